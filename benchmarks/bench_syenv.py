@@ -0,0 +1,304 @@
+"""Benchmark the Syenv loading, interpolation, selection and reads at scale.
+
+The environments are generated synthetically (seeded) and served through
+an EnvIndex, or set in the process environment (then restored) for the
+cold start measures going through the default source.
+
+Usage:
+    python benchmarks/bench_syenv.py --sizes 100 1000 --output results.json
+    python benchmarks/bench_syenv.py --compare results.json
+"""
+
+from __future__ import annotations
+import argparse
+from contextlib import contextmanager
+import json
+from operator import attrgetter
+import os
+import platform
+import random
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from syenv import EnvIndex, Syenv  # noqa: E402
+
+DEFAULT_SIZES: List[int] = [100, 1_000, 10_000, 100_000]
+DEFAULT_SEED: int = 42
+DEFAULT_THRESHOLD: float = 0.2
+PREFIXES: List[str] = ['APP_', 'DB_', 'CACHE_', 'FTP_', 'QUEUE_']
+CHAIN_DEPTH: int = 20
+TYPED_VALUES: List[Callable[[random.Random], str]] = [
+    lambda rand: f'value_{rand.randrange(10 ** 6)}',
+    lambda rand: f'int::{rand.randrange(10 ** 6)}',
+    lambda rand: f'float::{rand.random()}',
+    lambda rand: f'bool::{rand.choice(["True", ""])}',
+    lambda rand: f'pathlib.Path::/srv/{rand.randrange(100)}/data',
+    lambda rand: f'decimal.Decimal::{rand.randrange(10 ** 4)}.25',
+]
+
+
+def generate_env(size: int, seed: int = DEFAULT_SEED) -> Dict[str, str]:
+    """Generate a synthetic environment spread over many prefixes.
+    Each prefix gets typed values, a deep interpolation chain and a
+    wide fan-out on a base variable.
+
+    Args:
+        size (int): The number of variables to generate.
+        seed (int, optional): The random seed. Default to DEFAULT_SEED.
+
+    Returns:
+        Dict[str, str]: The generated variables.
+    """
+
+    rand: random.Random = random.Random(seed)
+    env: Dict[str, str] = {}
+    per_prefix: int = max(size // len(PREFIXES), CHAIN_DEPTH + 2)
+
+    for prefix in PREFIXES:
+        env[f'{prefix}BASE'] = f'https://{prefix.lower()}example.com'
+        parent: str = f'{prefix}BASE'
+
+        for depth in range(CHAIN_DEPTH):
+            env[f'{prefix}CHAIN_{depth}'] = f'{{{{{parent}}}}}/{depth}'
+            parent = f'{prefix}CHAIN_{depth}'
+
+        for i in range(per_prefix - CHAIN_DEPTH - 1):
+            if i % 5 == 0:
+                env[f'{prefix}WIDE_{i}'] = f'{{{{{prefix}BASE}}}}/w/{i}'
+            else:
+                env[f'{prefix}PARAM_{i}'] = rand.choice(TYPED_VALUES)(rand)
+
+    return env
+
+
+@contextmanager
+def patched_environ(env: Dict[str, str]) -> Iterator[None]:
+    """Set some variables in the process environment, restoring the
+    previous ones on exit.
+
+    Args:
+        env (Dict[str, str]): The variables to set.
+    """
+
+    saved: Dict[str, Optional[str]] = {key: os.environ.get(key) for key in env}
+    os.environ.update(env)
+
+    try:
+        yield
+    finally:
+        for key, val in saved.items():
+            if val is None:
+                del os.environ[key]
+            else:
+                os.environ[key] = val
+
+
+def timeit(func: Callable[[], Any], repeat: int) -> float:
+    """Get the best wall time of a callable over some runs.
+
+    Args:
+        func (Callable[[], Any]): The callable to measure.
+        repeat (int): The number of runs.
+
+    Returns:
+        float: The best time in seconds.
+    """
+
+    best: float = float('inf')
+
+    for _ in range(repeat):
+        start: float = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+
+    return best
+
+
+def peak_memory(func: Callable[[], Any]) -> int:
+    """Get the peak of memory allocated by a callable.
+
+    Args:
+        func (Callable[[], Any]): The callable to measure.
+
+    Returns:
+        int: The peak in bytes.
+    """
+
+    tracemalloc.start()
+
+    try:
+        func()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def bench_size(size: int, seed: int, repeat: int) -> Dict[str, Any]:
+    """Run all the benchmarks on an environment of a given size.
+
+    Args:
+        size (int): The number of variables.
+        seed (int): The random seed.
+        repeat (int): The number of runs per measure.
+
+    Returns:
+        Dict[str, Any]: The measures, the times in seconds and
+            the memory in bytes.
+    """
+
+    env: Dict[str, str] = generate_env(size, seed)
+    index: EnvIndex = EnvIndex(env)
+    conf: Syenv = Syenv('APP_', source=index)
+    read_all: Callable[[Syenv], Any] = attrgetter(*conf.as_dict)
+    raw_values: List[str] = [
+        val for val in index.select('APP_').values() if '{{' not in val
+    ]
+    interpolated: List[str] = [
+        val for val in index.select('APP_').values() if '{{' in val
+    ]
+
+    def select_uncached() -> None:
+        conf.BENCH_SELECTIONS_RESET = None
+        conf.from_pattern('PARAM_', to_lower=True)
+
+    def lazy_access_all() -> None:
+        read_all(Syenv('APP_', source=index, lazy=True))
+
+    def setattr_x1000() -> None:
+        target: Syenv = Syenv('APP_', source=index, lazy=True)
+
+        for i in range(1000):
+            setattr(target, f'CUSTOM_{i}', i)
+
+    with patched_environ(env):
+        init_environ: float = timeit(lambda: Syenv('APP_'), repeat)
+        init_environ_lazy: float = timeit(
+            lambda: Syenv('APP_', lazy=True), repeat
+        )
+
+    results: Dict[str, Any] = {
+        'variables': len(env),
+        'index_build': timeit(lambda: EnvIndex(env), repeat),
+        'init_environ': init_environ,
+        'init_environ_lazy': init_environ_lazy,
+        'init_one_prefix': timeit(lambda: Syenv('APP_', source=index), repeat),
+        'init_all_prefixes': timeit(lambda: index.load(*PREFIXES), repeat),
+        'init_lazy': timeit(
+            lambda: Syenv('APP_', source=index, lazy=True), repeat
+        ),
+        'lazy_access_all': timeit(lazy_access_all, repeat),
+        'read_all_attributes_x100': timeit(
+            lambda: [read_all(conf) for _ in range(100)], repeat
+        ),
+        'setattr_x1000': timeit(setattr_x1000, repeat),
+        'parse': timeit(
+            lambda: [conf._parse(val) for val in raw_values], repeat
+        ),
+        'interpolate': timeit(
+            lambda: [conf._interpolate(val) for val in interpolated], repeat
+        ),
+        'from_pattern_uncached': timeit(select_uncached, repeat),
+        'from_pattern_cached_x100': timeit(
+            lambda: [conf.from_pattern('PARAM_') for _ in range(100)],
+            repeat,
+        ),
+        'as_dict_x100': timeit(
+            lambda: [conf.as_dict for _ in range(100)], repeat
+        ),
+        'peak_memory_init_all_prefixes': peak_memory(
+            lambda: index.load(*PREFIXES)
+        ),
+    }
+
+    return results
+
+
+def compare(
+    results: Dict[str, Any], baseline: Dict[str, Any], threshold: float
+) -> List[str]:
+    """List the measures slower (or bigger) than the baseline
+    beyond the threshold.
+
+    Args:
+        results (Dict[str, Any]): The current results.
+        baseline (Dict[str, Any]): The baseline results.
+        threshold (float): The tolerated relative increase.
+
+    Returns:
+        List[str]: The regressions descriptions.
+    """
+
+    regressions: List[str] = []
+
+    for size, measures in results['sizes'].items():
+        for name, val in measures.items():
+            base: Optional[float] = baseline['sizes'].get(size, {}).get(name)
+
+            if name != 'variables' and base and val > base * (1 + threshold):
+                regressions.append(
+                    f'{size} {name}: {val:.6g} > {base:.6g} '
+                    f'(+{(val / base - 1) * 100:.1f}%)'
+                )
+
+    return regressions
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Run the benchmarks and emit the results as JSON.
+
+    Args:
+        argv (Optional[List[str]], optional): The command line arguments.
+            Default to None.
+
+    Returns:
+        int: The exit code, 1 if some regressions are detected.
+    """
+
+    parser: argparse.ArgumentParser = argparse.ArgumentParser(
+        description=__doc__.split('\n')[0]
+    )
+    parser.add_argument('--sizes', type=int, nargs='+', default=DEFAULT_SIZES)
+    parser.add_argument('--seed', type=int, default=DEFAULT_SEED)
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--output', type=Path)
+    parser.add_argument('--compare', type=Path)
+    parser.add_argument('--threshold', type=float, default=DEFAULT_THRESHOLD)
+    args: argparse.Namespace = parser.parse_args(argv)
+    results: Dict[str, Any] = {
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'seed': args.seed,
+        'sizes': {
+            str(size): bench_size(size, args.seed, args.repeat)
+            for size in args.sizes
+        },
+    }
+    output: str = json.dumps(results, indent=2)
+
+    if args.output:
+        args.output.write_text(output, encoding='utf-8')
+    else:
+        print(output)
+
+    if args.compare:
+        regressions: List[str] = compare(
+            results,
+            json.loads(args.compare.read_text(encoding='utf-8')),
+            args.threshold,
+        )
+
+        for regression in regressions:
+            print(f'REGRESSION {regression}', file=sys.stderr)
+
+        return 1 if regressions else 0
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
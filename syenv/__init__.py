@@ -1 +1,9 @@
-from syenv.syenv import Syenv
\ No newline at end of file
+from syenv.converters import ConverterRegistry, register_converter
+from syenv.exceptions import ConverterError, SchemaError
+from syenv.snapshot import SnapshotCache
+from syenv.sources import EnvFileSource, EnvironSource, MappingSource, Source
+from syenv.stats import LoadStats
+from syenv.syenv import ChangeSet, PinnedSyenv, Syenv
+from syenv.loader import EnvIndex
+from syenv.frozen import FrozenSyenv
+from syenv.schema import Field, Schema
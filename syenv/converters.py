@@ -0,0 +1,478 @@
+from __future__ import annotations
+from array import array, typecodes
+from functools import lru_cache
+import hashlib
+import marshal
+from pathlib import Path
+from pydoc import locate
+import re
+from syenv.exceptions import ConverterError, SysenvError
+from typing import Any, Callable, Dict, List, Optional, Pattern, Tuple
+
+Converter = Callable[[str], Any]
+
+_ITEMS_SEP: str = ','
+_PAIR_SEP: str = '='
+_ESCAPE: str = '\\'
+_SEQUENCE_REGEX: Pattern = re.compile(r'^(list|tuple|set|frozenset)\[(.+)\]$')
+_DICT_REGEX: Pattern = re.compile(r'^dict\[([^,]+),(.+)\]$')
+_ARRAY_REGEX: Pattern = re.compile(r'''^array\((['"])(\w)\1\)$''')
+_BOOLEANS: Dict[str, bool] = {
+    'true': True,
+    '1': True,
+    'yes': True,
+    'false': False,
+    '0': False,
+    'no': False,
+}
+_SEQUENCES: Dict[str, Callable[[Any], Any]] = {
+    'list': list,
+    'tuple': tuple,
+    'set': set,
+    'frozenset': frozenset,
+}
+
+
+def split_items(val: str, seps: str = _ITEMS_SEP) -> List[Tuple[str, str]]:
+    r"""Split a collection value on its separators, in a single pass.
+    A separator (or the escape character) preceded by a backslash is
+    taken literally.
+
+    Exemples:
+        split_items(r'a\,b,c')
+        >>> [('a,b', ','), ('c', '')]
+
+    Args:
+        val (str): The collection value.
+        seps (str, optional): The separators characters.
+            Default to _ITEMS_SEP.
+
+    Raises:
+        ValueError: If the value ends with a lone escape character.
+
+    Returns:
+        List[Tuple[str, str]]: The items and the separator which follows
+            each of them ('' for the last one).
+    """
+
+    items: List[Tuple[str, str]] = []
+    chars: List[str] = []
+    escaped: bool = False
+
+    for char in val:
+        if escaped:
+            chars.append(char)
+            escaped = False
+        elif char == _ESCAPE:
+            escaped = True
+        elif char in seps:
+            items.append((''.join(chars), char))
+            chars = []
+        else:
+            chars.append(char)
+
+    if escaped:
+        raise ValueError(f'The value "{val}" ends with a lone "{_ESCAPE}".')
+
+    items.append((''.join(chars), ''))
+    return items
+
+
+def _to_bool(val: str) -> bool:
+    """Parse a boolean value.
+
+    Args:
+        val (str): The value (true/false, 1/0 or yes/no, case insensitive).
+
+    Raises:
+        ValueError: If the value is not a boolean one.
+
+    Returns:
+        bool: The boolean.
+    """
+
+    try:
+        return _BOOLEANS[val.strip().lower()]
+    except KeyError:
+        raise ValueError(f'"{val}" is not a boolean value.')
+
+
+def _code_digest(converter: Converter) -> str:
+    """Get a digest of the behaviour of a function converter.
+
+    Args:
+        converter (Converter): The converter.
+
+    Returns:
+        str: The digest of the function code (its bytecode, constants
+            and names), or '' for the converters which aren't functions.
+    """
+
+    code: Any = getattr(converter, '__code__', None)
+
+    if code is None:
+        return ''
+
+    digest: Any = hashlib.sha256(marshal.dumps(code))
+    return f'#{digest.hexdigest()[:16]}'
+
+
+class ConverterRegistry:
+    """The ConverterRegistry class definition.
+    Resolve the type names used in the variables values to their
+    converter callable.
+
+    The builtins types are served from a static table, the registered
+    converters are served from their own table and any other dotted path
+    is located once and kept in a bounded cache.
+
+    Attributes:
+        cache_info (Any): The statistics of the dotted paths cache.
+        fingerprint (str): The description of the registered converters.
+    """
+
+    _BUILTINS: Dict[str, Converter] = {
+        'str': str,
+        'int': int,
+        'float': float,
+        'bool': bool,
+        'pathlib.Path': Path,
+    }
+    _DEFAULT_CACHE_SIZE: int = 256
+
+    def __init__(self, cache_size: int = _DEFAULT_CACHE_SIZE) -> None:
+        """The ConverterRegistry class constructor.
+
+        Args:
+            cache_size (int, optional): The maximum number of located
+                dotted paths to keep.
+                Default to ConverterRegistry._DEFAULT_CACHE_SIZE.
+        """
+
+        self._converters: Dict[str, Converter] = dict(self._BUILTINS)
+        self._collections: Dict[str, Converter] = {}
+        self._locate: Callable[[str], Any] = lru_cache(maxsize=cache_size)(
+            locate
+        )
+
+    @property
+    def cache_info(self) -> Any:
+        """Return the statistics of the dotted paths cache.
+
+        Returns:
+            Any: The lru_cache statistics (hits, misses, maxsize, currsize).
+        """
+
+        return self._locate.cache_info()
+
+    @property
+    def fingerprint(self) -> str:
+        """Return a description of the registered converters, stable
+        across processes.
+
+        Notes:
+            The functions are also described by a digest of their code,
+            so two lambdas (or two functions registered under the same
+            qualified name) don't share it. The values captured by their
+            closure are not part of it.
+
+        Returns:
+            str: The types names, their converters qualified names and
+                code digests.
+        """
+
+        return ';'.join(
+            f'{name}={getattr(converter, "__module__", None)}.'
+            f'{getattr(converter, "__qualname__", repr(converter))}'
+            f'{_code_digest(converter)}'
+            for name, converter in sorted(self._converters.items())
+        )
+
+    def register(
+        self, name: str, converter: Optional[Converter] = None
+    ) -> Any:
+        """Register a custom converter under a type name.
+        Can be used as a decorator if the converter is omitted.
+
+        Exemples:
+            registry.register('csv', lambda val: val.split(','))
+
+            @registry.register('upper')
+            def to_upper(val: str) -> str:
+                return val.upper()
+
+        Args:
+            name (str): The type name used in the variables values.
+            converter (Optional[Converter], optional): The callable which
+                takes the raw value and returns the converted one.
+                Default to None.
+
+        Raises:
+            SysenvError: If the converter is not callable.
+
+        Returns:
+            Any: The converter registered, or a decorator if the
+                converter is omitted.
+        """
+
+        if converter is None:
+            return lambda func: self.register(name, func)
+
+        if not callable(converter):
+            raise SysenvError(f'The converter "{name}" is not callable.')
+
+        self._converters[name] = converter
+        self._collections.clear()
+        return converter
+
+    def unregister(self, name: str) -> None:
+        """Remove a registered converter.
+        The builtins converters are restored if they were overridden.
+
+        Args:
+            name (str): The type name to remove.
+        """
+
+        self._converters.pop(name, None)
+        self._collections.clear()
+
+        if name in self._BUILTINS:
+            self._converters[name] = self._BUILTINS[name]
+
+    def resolve(self, name: str) -> Converter:
+        """Get the converter matching with the type name.
+
+        Args:
+            name (str): The type name or its dotted path.
+
+        Raises:
+            SysenvError: If the type name can't be resolved
+                to a callable.
+
+        Returns:
+            Converter: The converter callable.
+        """
+
+        if (converter := self._converters.get(name)) is not None:
+            return converter
+
+        if (converter := self._collections.get(name)) is not None:
+            return converter
+
+        if (converter := self._collection(name)) is not None:
+            self._collections[name] = converter
+            return converter
+
+        if callable(converter := self._locate(name)):
+            return converter
+
+        raise SysenvError(f'The type "{name}" doesn\'t exists.')
+
+    def exists(self, name: str) -> bool:
+        """Check if a type name can be resolved.
+
+        Args:
+            name (str): The type name or its dotted path.
+
+        Returns:
+            bool: True if the type name resolves to a callable.
+        """
+
+        try:
+            self.resolve(name)
+        except SysenvError:
+            return False
+
+        return True
+
+    def _collection(self, name: str) -> Optional[Converter]:
+        """Build the converter of a collection type name, its items being
+        converted with the converters of their own types.
+
+        Exemples:
+            self._collection('list[int]')('1,2,3')
+            >>> [1, 2, 3]
+
+            self._collection('dict[str,float]')('a=1.5,b=2')
+            >>> {'a': 1.5, 'b': 2.0}
+
+            self._collection("array('q')")('1,2,3')
+            >>> array('q', [1, 2, 3])
+
+        Args:
+            name (str): The type name.
+
+        Raises:
+            SysenvError: If the type of the items doesn't exists.
+            ConverterError: If the array typecode doesn't exists.
+
+        Returns:
+            Optional[Converter]: The converter, or None if the type name
+                is not a collection one.
+        """
+
+        if match := _SEQUENCE_REGEX.match(name):
+            return self._sequence(
+                name, _SEQUENCES[match[1]], self._item(match[2].strip())
+            )
+
+        if match := _DICT_REGEX.match(name):
+            return self._mapping(
+                name,
+                self._item(match[1].strip()),
+                self._item(match[2].strip()),
+            )
+
+        if match := _ARRAY_REGEX.match(name):
+            if match[2] not in typecodes:
+                raise ConverterError(
+                    f'The array typecode "{match[2]}" doesn\'t exists.'
+                )
+
+            typecode: str = match[2]
+            item_type: Converter = (
+                float if typecode in 'fd' else str if typecode == 'u' else int
+            )
+            return self._sequence(
+                name, lambda items: array(typecode, items), item_type
+            )
+
+        return None
+
+    def _item(self, name: str) -> Converter:
+        """Get the converter of the items of a collection type.
+        The boolean items are parsed strictly, bool taking any non-empty
+        string as True.
+
+        Args:
+            name (str): The items type name.
+
+        Raises:
+            SysenvError: If the type name can't be resolved.
+
+        Returns:
+            Converter: The items converter.
+        """
+
+        converter: Converter = self.resolve(name)
+        return _to_bool if converter is bool else converter
+
+    @staticmethod
+    def _sequence(
+        name: str, container: Callable[[Any], Any], item_type: Converter
+    ) -> Converter:
+        """Build the converter of a sequence type.
+
+        Args:
+            name (str): The type name, for the errors.
+            container (Callable[[Any], Any]): The container built
+                from the items.
+            item_type (Converter): The converter of the items.
+
+        Returns:
+            Converter: The sequence converter.
+        """
+
+        def convert(val: str) -> Any:
+            if not val:
+                return container([])
+
+            items: List[str] = (
+                [item for item, _ in split_items(val)]
+                if _ESCAPE in val
+                else val.split(_ITEMS_SEP)
+            )
+
+            try:
+                return container(item_type(item) for item in items)
+            except (ValueError, TypeError, OverflowError) as e:
+                raise ValueError(f'Invalid {name} value "{val}": {e}')
+
+        return convert
+
+    @staticmethod
+    def _mapping(
+        name: str, key_type: Converter, val_type: Converter
+    ) -> Converter:
+        """Build the converter of a dict type, the pairs being written
+        as key=value.
+
+        Args:
+            name (str): The type name, for the errors.
+            key_type (Converter): The converter of the keys.
+            val_type (Converter): The converter of the values.
+
+        Returns:
+            Converter: The dict converter.
+        """
+
+        def convert(val: str) -> Dict[Any, Any]:
+            if not val:
+                return {}
+
+            try:
+                return {
+                    key_type(key): val_type(item)
+                    for key, item in ConverterRegistry._pairs(val)
+                }
+            except (ValueError, TypeError, OverflowError) as e:
+                raise ValueError(f'Invalid {name} value "{val}": {e}')
+
+        return convert
+
+    @staticmethod
+    def _pairs(val: str) -> List[Tuple[str, str]]:
+        """Split a dict value to its key=value pairs.
+
+        Args:
+            val (str): The dict value.
+
+        Raises:
+            ValueError: If a pair is not written as key=value.
+
+        Returns:
+            List[Tuple[str, str]]: The keys and the values.
+        """
+
+        if _ESCAPE in val:
+            tokens: List[Tuple[str, str]] = split_items(
+                val, _ITEMS_SEP + _PAIR_SEP
+            )
+        else:
+            tokens = []
+
+            for item in val.split(_ITEMS_SEP):
+                parts: List[str] = item.split(_PAIR_SEP)
+                tokens.extend((part, _PAIR_SEP) for part in parts[:-1])
+                tokens.append((parts[-1], _ITEMS_SEP))
+
+        pairs: List[Tuple[str, str]] = []
+
+        for i in range(0, len(tokens), 2):
+            if (
+                tokens[i][1] != _PAIR_SEP
+                or i + 1 == len(tokens)
+                or tokens[i + 1][1] == _PAIR_SEP
+            ):
+                raise ValueError(
+                    f'the pair {i // 2 + 1} is not written '
+                    f'as key{_PAIR_SEP}value'
+                )
+
+            pairs.append((tokens[i][0], tokens[i + 1][0]))
+
+        return pairs
+
+    def clear_cache(self) -> None:
+        """Forget all the located dotted paths."""
+
+        self._locate.cache_clear()
+
+    def __contains__(self, name: str) -> bool:
+        """Check if a type name is served without locating it."""
+
+        return name in self._converters
+
+
+default_registry: ConverterRegistry = ConverterRegistry()
+register_converter: Callable[..., Any] = default_registry.register
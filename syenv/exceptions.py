@@ -1,4 +1,36 @@
+from typing import Dict
+
+
 class SysenvError(Exception):
     """The error generic exception for the Syenv class."""
 
     ...
+
+
+class ConverterError(SysenvError):
+    """The exception raised when a type name is recognized but can't
+    be built (like an array with an unknown typecode)."""
+
+    ...
+
+
+class SchemaError(SysenvError):
+    """The exception raised when some variables of a Schema are missing
+    or invalid. All the fields errors are reported together.
+
+    Attributes:
+        errors (Dict[str, str]): The error message by field name.
+    """
+
+    def __init__(self, errors: Dict[str, str]) -> None:
+        """The SchemaError class constructor.
+
+        Args:
+            errors (Dict[str, str]): The error message by field name.
+        """
+
+        self.errors: Dict[str, str] = errors
+        super().__init__(
+            f'{len(errors)} invalid variable(s):\n'
+            + '\n'.join(f'  {name}: {error}' for name, error in errors.items())
+        )
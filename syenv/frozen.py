@@ -0,0 +1,270 @@
+from __future__ import annotations
+from collections.abc import Mapping
+from multiprocessing import resource_tracker
+from multiprocessing.shared_memory import SharedMemory
+import pickle
+import struct
+from syenv.exceptions import SysenvError
+from syenv.syenv import Syenv, _select
+from typing import Any, Dict, Generator, Iterator, List, Optional, Tuple
+
+_HEADER: struct.Struct = struct.Struct('<Q')
+
+
+class FrozenSyenv:
+    """The FrozenSyenv class definition.
+    An immutable copy of the resolved variables of a Syenv object, held
+    in a shared memory block. The parent process freezes the object once
+    and the workers attach to the block by its name (or inherit it when
+    forked), then unpickle each variable on its first access only.
+
+    Notes:
+        The block layout is a little-endian uint64 holding the offset of
+        the index, the pickled values, then the pickled index
+        ({name: (offset, size)}).
+
+    Attributes:
+        name (str): The shared memory block name.
+        as_dict (Dict[str, Any]): The variables as dict format.
+    """
+
+    __slots__ = ('_shm', '_index', '_cache', '_owner')
+
+    def __init__(self, shm: SharedMemory, owner: bool = False) -> None:
+        """The FrozenSyenv class constructor.
+        Prefer the FrozenSyenv.freeze and FrozenSyenv.attach methods.
+
+        Args:
+            shm (SharedMemory): The shared memory block.
+            owner (bool, optional): Indicate if the object created the
+                block, and so is in charge of unlinking it.
+                Default to False.
+        """
+
+        self._shm: SharedMemory = shm
+        self._index: Dict[str, Tuple[int, int]] = pickle.loads(
+            shm.buf[_HEADER.unpack_from(shm.buf)[0] :]
+        )
+        self._cache: Dict[str, Any] = {}
+        self._owner: bool = owner
+
+    @classmethod
+    def freeze(cls, env: Syenv, name: Optional[str] = None) -> FrozenSyenv:
+        """Copy the variables of a Syenv object to a new shared
+        memory block.
+
+        Args:
+            env (Syenv): The object to freeze. Its pending variables
+                are resolved first.
+            name (Optional[str], optional): The block name. Default to None
+                (a random name).
+
+        Raises:
+            SysenvError: If a variable value can't be pickled.
+
+        Returns:
+            FrozenSyenv: The frozen object, owner of the block.
+        """
+
+        index: Dict[str, Tuple[int, int]] = {}
+        blobs: List[bytes] = []
+        offset: int = _HEADER.size
+
+        for key, val in env.as_mapping.items():
+            try:
+                blob: bytes = pickle.dumps(val, pickle.HIGHEST_PROTOCOL)
+            except (pickle.PicklingError, TypeError, AttributeError) as e:
+                raise SysenvError(
+                    f'The variable "{key}" can\'t be frozen: {e}'
+                )
+
+            index[key] = (offset, len(blob))
+            blobs.append(blob)
+            offset += len(blob)
+
+        footer: bytes = pickle.dumps(index, pickle.HIGHEST_PROTOCOL)
+        shm: SharedMemory = SharedMemory(
+            name=name, create=True, size=offset + len(footer)
+        )
+        _HEADER.pack_into(shm.buf, 0, offset)
+
+        for (start, size), blob in zip(index.values(), blobs):
+            shm.buf[start : start + size] = blob
+
+        shm.buf[offset : offset + len(footer)] = footer
+        return cls(shm, owner=True)
+
+    @classmethod
+    def attach(cls, name: str) -> FrozenSyenv:
+        """Attach to a block frozen by another process.
+
+        Args:
+            name (str): The block name.
+
+        Returns:
+            FrozenSyenv: The frozen object, not owner of the block.
+        """
+
+        try:
+            shm: SharedMemory = SharedMemory(name=name, track=False)
+        except TypeError:
+            shm = SharedMemory(name=name)
+            resource_tracker.unregister(shm._name, 'shared_memory')
+
+        return cls(shm)
+
+    @property
+    def name(self) -> str:
+        """Return the shared memory block name.
+
+        Returns:
+            str: The block name.
+        """
+
+        return self._shm.name
+
+    @property
+    def as_dict(self) -> Dict[str, Any]:
+        """Return all the variables in dict format.
+
+        Returns:
+            Dict[str, Any]: The variables.
+        """
+
+        return {key: val for key, val in self.__iter__()}
+
+    def from_pattern(
+        self, pattern: str, keep_pattern: bool = False, to_lower: bool = False
+    ) -> Dict[str, Any]:
+        """Get the variables which names matches with the pattern
+        passed in parameter, like Syenv.from_pattern.
+
+        Args:
+            pattern (str): The string to search in attributes.
+            keep_pattern (bool, optional): Specify if the pattern should be
+                returned as the name of the variable name. Default to False.
+            to_lower (bool, optional): Specify if the key should be forced
+                in lower case. Default to False.
+
+        Returns:
+            Dict[str, Any]: The attributes matched.
+        """
+
+        return _select(_FrozenValues(self), pattern, keep_pattern, to_lower)
+
+    def close(self) -> None:
+        """Detach from the block, and unlink it if this object
+        created it."""
+
+        self._cache.clear()
+        self._shm.close()
+
+        if self._owner:
+            self._shm.unlink()
+
+    def _get(self, key: str) -> Any:
+        """Get a variable, unpickling it on its first access.
+
+        Args:
+            key (str): The variable name.
+
+        Raises:
+            KeyError: If the variable doesn't exists.
+
+        Returns:
+            Any: The variable value.
+        """
+
+        if key in self._cache:
+            return self._cache[key]
+
+        offset, size = self._index[key]
+        val: Any = pickle.loads(self._shm.buf[offset : offset + size])
+        self._cache[key] = val
+        return val
+
+    def __getattr__(self, name: str) -> Any:
+        """Get a variable as an attribute.
+
+        Raises:
+            AttributeError: If the variable doesn't exists.
+        """
+
+        if not name.startswith('__') and name not in self.__slots__:
+            try:
+                return self._get(name)
+            except KeyError:
+                pass
+
+        raise AttributeError(
+            f'\'{type(self).__name__}\' object has no attribute \'{name}\''
+        )
+
+    def __setattr__(self, name: str, val: Any) -> None:
+        """Forbid to set the variables.
+
+        Raises:
+            SysenvError: If the attribute is not an internal one.
+        """
+
+        if name not in self.__slots__:
+            raise SysenvError(f'The frozen variable "{name}" is read-only.')
+
+        super().__setattr__(name, val)
+
+    def __contains__(self, key: str) -> bool:
+        """Check if a variable exists."""
+
+        return key in self._index
+
+    def __len__(self) -> int:
+        """Get the number of variables."""
+
+        return len(self._index)
+
+    def __iter__(self) -> Generator:
+        """Iterate over the variables names and values."""
+
+        for key in self._index:
+            yield key, self._get(key)
+
+    def __enter__(self) -> FrozenSyenv:
+        """Use the frozen object as a context manager."""
+
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        """Close the frozen object on exit."""
+
+        self.close()
+
+
+class _FrozenValues(Mapping):
+    """A mapping view of the variables of a FrozenSyenv object,
+    unpickling only the values which are read."""
+
+    __slots__ = ('_frozen',)
+
+    def __init__(self, frozen: FrozenSyenv) -> None:
+        """The _FrozenValues class constructor.
+
+        Args:
+            frozen (FrozenSyenv): The frozen object.
+        """
+
+        self._frozen: FrozenSyenv = frozen
+
+    def __getitem__(self, key: str) -> Any:
+        """Get a variable value."""
+
+        return self._frozen._get(key)
+
+    def __iter__(self) -> Iterator[str]:
+        """Iterate over the variables names."""
+
+        return iter(self._frozen._index)
+
+    def __len__(self) -> int:
+        """Get the number of variables."""
+
+        return len(self._frozen)
@@ -0,0 +1,165 @@
+from __future__ import annotations
+from functools import lru_cache
+import re
+from syenv.exceptions import SysenvError
+from typing import Any, Callable, Dict, List, Mapping, Pattern, Tuple
+
+INTERP_REGEX: str = r'{{(\w+)}}'
+_INTERP_PATTERN: Pattern = re.compile(INTERP_REGEX)
+_TEMPLATES_CACHE_SIZE: int = 4096
+_INTERP_MARK: str = '{{'
+
+
+class Template:
+    """The Template class definition.
+    A variable value parsed once into its literal parts and its
+    interpolated keys.
+
+    Attributes:
+        source (str): The raw value.
+        parts (Tuple[str, ...]): The literals and the keys alternately,
+            the keys being at the odd indexes.
+        keys (Tuple[str, ...]): The interpolated keys, in order.
+    """
+
+    __slots__ = ('source', 'parts', 'keys')
+
+    def __init__(self, source: str) -> None:
+        """The Template class constructor.
+
+        Args:
+            source (str): The raw value to compile.
+        """
+
+        self.source: str = source
+        self.parts: Tuple[str, ...] = (
+            tuple(_INTERP_PATTERN.split(source))
+            if _INTERP_MARK in source
+            else (source,)
+        )
+        self.keys: Tuple[str, ...] = self.parts[1::2]
+
+    def render(self, lookup: Callable[[str], Any]) -> str:
+        """Replace the interpolated keys with their values.
+
+        Args:
+            lookup (Callable[[str], Any]): The callable which returns
+                the value of an interpolated key.
+
+        Returns:
+            str: The rendered value.
+        """
+
+        if not self.keys:
+            return self.source
+
+        parts: List[str] = list(self.parts)
+
+        for i in range(1, len(parts), 2):
+            parts[i] = str(lookup(parts[i]))
+
+        return ''.join(parts)
+
+
+def compile_template(source: str) -> Template:
+    """Compile a variable value to a template.
+    The templates interpolating some keys are memoized by their source,
+    the plain values are not kept.
+
+    Args:
+        source (str): The raw value.
+
+    Returns:
+        Template: The compiled template.
+    """
+
+    if _INTERP_MARK not in source:
+        return Template(source)
+
+    return _compile_interpolated(source)
+
+
+@lru_cache(maxsize=_TEMPLATES_CACHE_SIZE)
+def _compile_interpolated(source: str) -> Template:
+    """Compile a value interpolating some keys, memoized by its source.
+
+    Args:
+        source (str): The raw value.
+
+    Returns:
+        Template: The compiled template.
+    """
+
+    return Template(source)
+
+
+def resolution_order(graph: Mapping[str, Tuple[str, ...]]) -> List[str]:
+    """Sort the keys so that each one comes after the keys
+    it interpolates (Kahn's algorithm).
+    The dependencies which are not part of the graph are ignored.
+
+    Args:
+        graph (Mapping[str, Tuple[str, ...]]): The interpolated keys
+            of each key.
+
+    Raises:
+        SysenvError: If some keys interpolate each other.
+
+    Returns:
+        List[str]: The keys in resolution order.
+    """
+
+    pending: Dict[str, int] = dict.fromkeys(graph, 0)
+    dependents: Dict[str, List[str]] = {}
+
+    for key, deps in graph.items():
+        for dep in set(deps):
+            if dep in pending:
+                pending[key] += 1
+                dependents.setdefault(dep, []).append(key)
+
+    order: List[str] = [key for key, count in pending.items() if not count]
+
+    for key in order:
+        for dependent in dependents.get(key, ()):
+            pending[dependent] -= 1
+
+            if not pending[dependent]:
+                order.append(dependent)
+
+    if len(order) != len(pending):
+        raise SysenvError(
+            'Circular interpolation detected: '
+            + ' -> '.join(_find_cycle(graph, pending))
+        )
+
+    return order
+
+
+def _find_cycle(
+    graph: Mapping[str, Tuple[str, ...]], pending: Dict[str, int]
+) -> List[str]:
+    """Walk the unresolved keys until one of them is met twice.
+
+    Args:
+        graph (Mapping[str, Tuple[str, ...]]): The interpolated keys
+            of each key.
+        pending (Dict[str, int]): The remaining dependencies count
+            of each key.
+
+    Returns:
+        List[str]: The keys forming the cycle, the first one repeated
+            at the end.
+    """
+
+    path: List[str] = [next(key for key, count in pending.items() if count)]
+    seen: Dict[str, int] = {path[0]: 0}
+
+    while True:
+        key: str = next(dep for dep in graph[path[-1]] if pending.get(dep))
+
+        if key in seen:
+            return path[seen[key] :] + [key]
+
+        seen[key] = len(path)
+        path.append(key)
@@ -0,0 +1,80 @@
+from __future__ import annotations
+from bisect import bisect_left
+import os
+from syenv.sources import Source
+from syenv.syenv import Syenv
+from typing import Any, Dict, List, Mapping, Optional
+
+
+class EnvIndex(Source):
+    """The EnvIndex class definition.
+    Copy the environment variables once and index their keys, so many
+    Syenv objects can select their prefix without scanning the whole
+    environment again.
+
+    Notes:
+        The index is a snapshot: the environment variables changed after
+        its creation are not seen by the Syenv objects hydrated from it.
+
+    Attributes:
+        keys (List[str]): The sorted environment variables keys.
+    """
+
+    def __init__(self, environ: Optional[Mapping[str, str]] = None) -> None:
+        """The EnvIndex class constructor.
+
+        Args:
+            environ (Optional[Mapping[str, str]], optional): The variables
+                to index. Default to os.environ.
+        """
+
+        self._items: Dict[str, str] = dict(
+            os.environ if environ is None else environ
+        )
+        self.keys: List[str] = sorted(self._items)
+
+    def select(self, prefix: str) -> Dict[str, str]:
+        """Get the variables which keys starts with the prefix.
+        The prefix is a plain string, not a pattern.
+
+        Args:
+            prefix (str): The variables prefix.
+
+        Returns:
+            Dict[str, str]: The variables selected, sorted by key.
+        """
+
+        selected: Dict[str, str] = {}
+
+        for i in range(bisect_left(self.keys, prefix), len(self.keys)):
+            if not self.keys[i].startswith(prefix):
+                break
+
+            selected[self.keys[i]] = self._items[self.keys[i]]
+
+        return selected
+
+    def load(self, *prefixes: str, **kwargs: Any) -> Dict[str, Syenv]:
+        """Hydrate a Syenv object for each prefix from the index.
+
+        Exemples:
+            envs = EnvIndex().load('DB_', 'CACHE_', keep_prefix=True)
+            envs['DB_'].DB_HOST
+            >>> 'localhost'
+
+        Args:
+            *prefixes (str): The variables prefixes.
+            **kwargs (Any): The Syenv parameters shared by all the objects.
+
+        Returns:
+            Dict[str, Syenv]: The Syenv objects by prefix.
+        """
+
+        return {
+            prefix: Syenv(prefix, source=self, **kwargs) for prefix in prefixes
+        }
+
+    def __len__(self) -> int:
+        """Get the number of variables indexed."""
+
+        return len(self.keys)
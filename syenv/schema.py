@@ -0,0 +1,524 @@
+from __future__ import annotations
+import copy
+import sys
+import types
+from time import perf_counter
+from syenv.converters import ConverterRegistry, _to_bool
+from syenv.exceptions import SchemaError, SysenvError
+from syenv.interpolation import compile_template
+from syenv.sources import Source
+from syenv.stats import LoadStats
+from syenv.syenv import _MISSING, ChangeSet, Syenv, _fold_index
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    ClassVar,
+    Dict,
+    List,
+    Optional,
+    Tuple,
+    Union,
+    get_args,
+    get_origin,
+    get_type_hints,
+)
+
+if TYPE_CHECKING:
+    from syenv.loader import EnvIndex
+
+
+_COLLECTIONS: Tuple[type, ...] = (list, tuple, set, frozenset, dict)
+_UNIONS: Tuple[Any, ...] = (Union, getattr(types, 'UnionType', Union))
+
+
+class Field:
+    """The Field class definition.
+    The declaration of a Schema variable, given as its class attribute
+    value when it needs a default value, an alias or a converter.
+
+    Exemples:
+        class Config(Schema, prefix='MY_APP_'):
+            TIMEOUT: float = Field(30.0, alias='TIMEOUT_SECONDS')
+
+    Attributes:
+        default (Any): The value used when the variable is not set,
+            copied for each object (so a mutable default is not shared).
+        alias (Optional[str]): The variable key, without the prefix.
+            Default to the field name.
+        converter (Optional[Callable[[str], Any]]): The callable which
+            converts the raw value. Default to the one of the annotation.
+        name (str): The field name, set when the schema is compiled.
+        key (str): The variable key without the prefix, set when the
+            schema is compiled.
+    """
+
+    __slots__ = ('default', 'alias', 'converter', 'name', 'key')
+
+    def __init__(
+        self,
+        default: Any = _MISSING,
+        *,
+        alias: Optional[str] = None,
+        converter: Optional[Callable[[str], Any]] = None,
+    ) -> None:
+        """The Field class constructor.
+
+        Args:
+            default (Any, optional): The value used when the variable is not
+                set. Default to none (the variable is required).
+            alias (Optional[str], optional): The variable key, without the
+                prefix. Default to None (the field name).
+            converter (Optional[Callable[[str], Any]], optional): The
+                callable which converts the raw value. Default to None
+                (the one of the annotation).
+        """
+
+        self.default: Any = default
+        self.alias: Optional[str] = alias
+        self.converter: Optional[Callable[[str], Any]] = converter
+        self.name: str = ''
+        self.key: str = ''
+
+    @property
+    def required(self) -> bool:
+        """Indicate if the variable has no default value.
+
+        Returns:
+            bool: True if the variable must be set.
+        """
+
+        return self.default is _MISSING
+
+    def __repr__(self) -> str:
+        """Get the field representation."""
+
+        return f'Field(name={self.name!r}, key={self.key!r})'
+
+
+class Schema(Syenv):
+    """The Schema class definition.
+    A Syenv object which only loads the variables declared by the
+    annotations of its class, converted with their annotated type.
+
+    The schema is compiled once per class: the converters are resolved
+    and an accessor is generated for each field, so an instantiation only
+    selects, converts and validates the declared variables. The missing
+    and invalid variables are all reported by a single SchemaError.
+
+    Exemples:
+        class Config(Schema, prefix='MY_APP_'):
+            HOST: str
+            PORT: int = 8000
+            HOSTS: List[str] = Field(alias='ALLOWED_HOSTS', default=[])
+            TIMEOUT: Optional[float]
+
+        Config().PORT
+        >>> 8000
+
+        Config('TENANT_A_').HOST
+        >>> 'tenant-a.local'
+
+    Notes:
+        The values are not prefixed by their type: the type is the
+        annotation (a bool being written true/false, 1/0 or yes/no). Only
+        the declared variables, and the variables they interpolate, are
+        rendered, with the raw values.
+
+        An Optional annotation defaults to None, and the collections
+        (List[int], Dict[str, float]...) are written like the typed
+        collection values (see ConverterRegistry).
+
+        The fields being converted by their own converters and validated
+        all at once, the converters, lazy, snapshot and executor
+        parameters of Syenv are not supported.
+    """
+
+    __slots__ = ()
+
+    _DEFAULT_PREFIX: ClassVar[str] = ''
+    _FIELDS: ClassVar[Tuple[Field, ...]] = ()
+
+    def __init_subclass__(
+        cls, prefix: Optional[str] = None, **kwargs: Any
+    ) -> None:
+        """Compile the schema of a subclass.
+
+        Args:
+            prefix (Optional[str], optional): The default variables prefix
+                of the subclass. Default to None (the inherited one).
+            **kwargs (Any): The other class parameters.
+
+        Raises:
+            SysenvError: If an annotation has no converter.
+        """
+
+        super().__init_subclass__(**kwargs)
+
+        if prefix is not None:
+            cls._DEFAULT_PREFIX = prefix
+
+        fields: Dict[str, Field] = {field.name: field for field in cls._FIELDS}
+        annotations: Dict[str, Any] = cls.__dict__.get('__annotations__', {})
+        hints: Dict[str, Any] = get_type_hints(cls) if annotations else {}
+
+        for name in annotations:
+            if name.startswith('_') or get_origin(hints[name]) is ClassVar:
+                continue
+
+            fields[name] = _compile_field(
+                name, cls.__dict__.get(name, _MISSING), annotation=hints[name]
+            )
+            setattr(cls, name, _accessor(name))
+
+        for name, field in fields.items():
+            if name not in annotations and name in cls.__dict__:
+                fields[name] = _compile_field(
+                    name, cls.__dict__[name], inherited=field
+                )
+                setattr(cls, name, _accessor(name))
+
+        cls._FIELDS = tuple(fields.values())
+
+    def __init__(
+        self,
+        prefix: Optional[str] = None,
+        *,
+        index: Optional[EnvIndex] = None,
+        source: Optional[Source] = None,
+        stats: Optional[LoadStats] = None,
+    ) -> None:
+        """The Schema class constructor.
+        Load and validate the declared variables.
+
+        Args:
+            prefix (Optional[str], optional): The variables prefixe.
+                Default to the prefix of the class.
+            index (Optional[EnvIndex], optional): Deprecated, an EnvIndex
+                is passed as the source. Default to None.
+            source (Optional[Source], optional): The source to select the
+                variables from. Default to None (os.environ).
+            stats (Optional[LoadStats], optional): The collector of the
+                loading timings. Default to None.
+
+        Raises:
+            SchemaError: If some variables are missing or invalid.
+        """
+
+        super().__init__(
+            self._DEFAULT_PREFIX if prefix is None else prefix,
+            source=_fold_index(index, source),
+            stats=stats,
+        )
+
+    @classmethod
+    def fields(cls) -> Tuple[Field, ...]:
+        """Get the compiled fields of the schema, in declaration order.
+
+        Returns:
+            Tuple[Field, ...]: The fields.
+        """
+
+        return cls._FIELDS
+
+    def reload(
+        self,
+        index: Optional[EnvIndex] = None,
+        source: Optional[Source] = None,
+    ) -> ChangeSet:
+        """Load and validate the declared variables again.
+        On error, the previous values are kept.
+
+        Args:
+            index (Optional[EnvIndex], optional): Deprecated, an EnvIndex
+                is passed as the source. Default to None.
+            source (Optional[Source], optional): A new source to select the
+                variables from. Default to None.
+
+        Raises:
+            SchemaError: If some variables are missing or invalid.
+
+        Returns:
+            ChangeSet: The fields names touched by the reload, the
+                dependents being the fields which raw value didn't change
+                but which interpolate a changed variable.
+        """
+
+        if (source := _fold_index(index, source)) is not None:
+            self._source = source
+
+        start: float = perf_counter()
+        old_raw: Dict[str, str] = self._raw
+        old: Dict[str, Any] = {
+            field.name: self._store.get(field.name, _MISSING)
+            for field in self._FIELDS
+        }
+        self._hydrate()
+        touched: Tuple[List[str], ...] = ([], [], [], [])
+
+        for field in self._FIELDS:
+            key: str = self._prefix + field.key
+            old_val: Optional[str] = old_raw.get(key)
+            new_val: Optional[str] = self._raw.get(key)
+
+            if old_val is None and new_val is not None:
+                touched[0].append(field.name)
+            elif old_val != new_val:
+                touched[1 if new_val is not None else 2].append(field.name)
+            elif self._store[field.name] != old[field.name]:
+                touched[3].append(field.name)
+
+        if self._stats is not None:
+            self._stats.record_load(
+                'reload', self._prefix, perf_counter() - start
+            )
+
+        return ChangeSet(*(tuple(names) for names in touched))
+
+    def _loadenv(self) -> None:
+        """Hydrate the Schema object with the declared variables.
+
+        Raises:
+            SchemaError: If some variables are missing or invalid.
+        """
+
+        start: float = perf_counter()
+        self._hydrate()
+
+        if self._stats is not None:
+            self._stats.record_load(
+                'load', self._prefix, perf_counter() - start
+            )
+
+    def _hydrate(self) -> None:
+        """Convert the declared variables, then publish them all at once
+        if none failed.
+
+        Raises:
+            SchemaError: If some variables are missing or invalid.
+        """
+
+        raw: Dict[str, str] = self._select()
+        rendered: Dict[str, str] = {}
+        values: Dict[str, Any] = {}
+        errors: Dict[str, str] = {}
+
+        for field in self._FIELDS:
+            key: str = self._prefix + field.key
+
+            if key not in raw:
+                if field.required:
+                    errors[field.name] = f'The variable "{key}" is missing.'
+                else:
+                    values[field.name] = copy.deepcopy(field.default)
+
+                continue
+
+            try:
+                val: str = self._render(raw, key, rendered)
+            except SysenvError as e:
+                errors[field.name] = (
+                    f'The variable "{key}" can\'t be interpolated: {e}'
+                )
+                continue
+
+            try:
+                values[field.name] = field.converter(val)
+            except (SysenvError, ValueError, TypeError) as e:
+                errors[field.name] = (
+                    f'The variable "{key}" value "{val}" is invalid: {e}'
+                )
+
+        if errors:
+            raise SchemaError(errors)
+
+        with self._staging() as store:
+            self._raw = raw
+            store.update(values)
+
+    @staticmethod
+    def _render(
+        raw: Dict[str, str],
+        key: str,
+        rendered: Dict[str, str],
+        path: Tuple[str, ...] = (),
+    ) -> str:
+        """Render the interpolations of a variable, and of the variables
+        it interpolates (only).
+
+        Args:
+            raw (Dict[str, str]): The raw variables.
+            key (str): The variable key.
+            rendered (Dict[str, str]): The variables already rendered,
+                completed in place.
+            path (Tuple[str, ...], optional): The keys being rendered,
+                to detect the circular interpolations. Default to ().
+
+        Raises:
+            SysenvError: If an interpolated variable doesn't exists or if
+                some variables interpolate each other.
+
+        Returns:
+            str: The rendered value.
+        """
+
+        if key in rendered:
+            return rendered[key]
+
+        if key not in raw:
+            raise SysenvError(
+                f'The interpolated key "{key}" doesn\'t '
+                f'exists in the schema variables.'
+            )
+
+        if '{{' not in raw[key]:
+            return raw[key]
+
+        if key in path:
+            raise SysenvError(
+                'Circular interpolation detected: '
+                + ' -> '.join((*path[path.index(key) :], key))
+            )
+
+        rendered[key] = compile_template(raw[key]).render(
+            lambda dep: Schema._render(raw, dep, rendered, (*path, key))
+        )
+        return rendered[key]
+
+
+def _compile_field(
+    name: str,
+    value: Any,
+    annotation: Any = None,
+    inherited: Optional[Field] = None,
+) -> Field:
+    """Build the field of a class attribute.
+
+    Args:
+        name (str): The attribute name.
+        value (Any): The class attribute value (a Field, a default value
+            or nothing).
+        annotation (Any, optional): The attribute type. Default to None.
+        inherited (Optional[Field], optional): The field declared by a
+            parent class, when the attribute only overrides it.
+            Default to None.
+
+    Raises:
+        SysenvError: If the annotation has no converter.
+
+    Returns:
+        Field: The compiled field.
+    """
+
+    declared: Field = value if isinstance(value, Field) else Field(value)
+    field: Field = Field(
+        declared.default,
+        alias=declared.alias,
+        converter=declared.converter,
+    )
+    field.name = sys.intern(name)
+
+    if inherited is not None:
+        field.alias = field.alias or inherited.alias
+        field.converter = field.converter or inherited.converter
+    elif field.converter is None:
+        field.converter = _converter(name, annotation)
+
+    if field.required and _is_optional(annotation):
+        field.default = None
+
+    field.key = field.alias or name
+    return field
+
+
+def _accessor(name: str) -> property:
+    """Generate the accessor of a field, reading the variables store.
+
+    Args:
+        name (str): The field name.
+
+    Returns:
+        property: The accessor.
+    """
+
+    def get(self: Schema) -> Any:
+        try:
+            return self._store[name]
+        except KeyError:
+            raise AttributeError(
+                f'\'{type(self).__name__}\' object has no attribute '
+                f'\'{name}\''
+            )
+
+    def set(self: Schema, val: Any) -> None:
+        with self._staging() as store:
+            store[name] = val
+
+    return property(get, set)
+
+
+def _is_optional(annotation: Any) -> bool:
+    """Check if an annotation is an Optional one.
+
+    Args:
+        annotation (Any): The annotation.
+
+    Returns:
+        bool: True if the annotation accepts None.
+    """
+
+    return get_origin(annotation) in _UNIONS and type(None) in get_args(
+        annotation
+    )
+
+
+def _converter(name: str, annotation: Any) -> Callable[[str], Any]:
+    """Get the converter of an annotation.
+    The classes are their own converter (except bool, parsed from
+    true/false, 1/0 or yes/no), the Optional annotations use the converter
+    of their type and the collections convert their items with the
+    converters of their items types.
+
+    Args:
+        name (str): The field name.
+        annotation (Any): The field annotation.
+
+    Raises:
+        SysenvError: If the annotation has no converter.
+
+    Returns:
+        Callable[[str], Any]: The converter.
+    """
+
+    origin: Any = get_origin(annotation)
+
+    if _is_optional(annotation):
+        args: List[Any] = [
+            arg for arg in get_args(annotation) if arg is not type(None)
+        ]
+
+        if len(args) == 1:
+            return _converter(name, args[0])
+    elif origin in _COLLECTIONS:
+        args = [arg for arg in get_args(annotation) if arg is not Ellipsis]
+
+        if origin is dict and len(args) == 2:
+            return ConverterRegistry._mapping(
+                repr(annotation),
+                _converter(name, args[0]),
+                _converter(name, args[1]),
+            )
+
+        if origin is not dict and len(args) == 1:
+            return ConverterRegistry._sequence(
+                repr(annotation), origin, _converter(name, args[0])
+            )
+    elif annotation is bool:
+        return _to_bool
+    elif isinstance(annotation, type) and annotation is not Any:
+        return annotation
+
+    raise SysenvError(
+        f'The field "{name}" annotation "{annotation}" has no converter, '
+        f'use Field(converter=...) instead.'
+    )
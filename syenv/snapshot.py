@@ -0,0 +1,138 @@
+from __future__ import annotations
+import hashlib
+import os
+import pickle
+import tempfile
+from pathlib import Path
+from syenv.converters import ConverterRegistry
+from typing import Any, Dict, Mapping, Optional, Tuple, Union
+
+
+class SnapshotCache:
+    """The SnapshotCache class definition.
+    Persist the resolved variables of a Syenv object on disk, keyed by
+    everything their resolution depends on, so an identical environment
+    can be loaded without interpolating and converting it again.
+
+    Notes:
+        The snapshot is a pickle file: its path must only be writable
+        by trusted users.
+
+    Attributes:
+        path (Path): The snapshot file path.
+    """
+
+    _FORMAT_VERSION: int = 1
+    _PICKLE_ERRORS: Tuple[type, ...] = (
+        pickle.PicklingError,
+        TypeError,
+        AttributeError,
+    )
+
+    def __init__(self, path: Union[str, Path]) -> None:
+        """The SnapshotCache class constructor.
+
+        Args:
+            path (Union[str, Path]): The snapshot file path. Its parent
+                directory is created if needed.
+        """
+
+        self.path: Path = Path(path)
+
+    def key(
+        self,
+        raw: Mapping[str, str],
+        prefix: str,
+        type_separator: str,
+        keep_prefix: bool,
+        converters: ConverterRegistry,
+    ) -> str:
+        """Compute the key of a resolution.
+
+        Args:
+            raw (Mapping[str, str]): The raw variables selected.
+            prefix (str): The variables prefix.
+            type_separator (str): The type separator.
+            keep_prefix (bool): Indicate if the prefix is kept.
+            converters (ConverterRegistry): The converters registry.
+
+        Returns:
+            str: The hexadecimal key.
+        """
+
+        digest: Any = hashlib.sha256()
+
+        for part in (
+            str(self._FORMAT_VERSION),
+            prefix,
+            type_separator,
+            str(keep_prefix),
+            converters.fingerprint,
+            *(f'{key}={val}' for key, val in sorted(raw.items())),
+        ):
+            digest.update(part.encode('utf-8', 'surrogateescape') + b'\0')
+
+        return digest.hexdigest()
+
+    def load(self, key: str) -> Optional[Dict[str, Any]]:
+        """Read the snapshot if it matches with the key.
+
+        Args:
+            key (str): The expected key.
+
+        Returns:
+            Optional[Dict[str, Any]]: The resolved values (without the ones
+                which couldn't be pickled), or None if the snapshot is
+                missing, stale or unreadable.
+        """
+
+        try:
+            data: Any = pickle.loads(self.path.read_bytes())
+        except Exception:
+            return None
+
+        if not isinstance(data, dict) or data.get('key') != key:
+            return None
+
+        return data['values']
+
+    def save(self, key: str, values: Mapping[str, Any]) -> None:
+        """Write the snapshot atomically.
+        The values which can't be pickled are left out, to be resolved
+        again on load.
+        The write errors are ignored: the snapshot is only a cache.
+
+        Args:
+            key (str): The key of the resolution.
+            values (Mapping[str, Any]): The resolved values.
+        """
+
+        data: Dict[str, Any] = {'key': key, 'values': dict(values)}
+
+        try:
+            payload: bytes = pickle.dumps(data, pickle.HIGHEST_PROTOCOL)
+        except self._PICKLE_ERRORS:
+            for name, val in values.items():
+                try:
+                    pickle.dumps(val, pickle.HIGHEST_PROTOCOL)
+                except self._PICKLE_ERRORS:
+                    del data['values'][name]
+
+            payload = pickle.dumps(data, pickle.HIGHEST_PROTOCOL)
+
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp = tempfile.mkstemp(
+                dir=self.path.parent, prefix=f'.{self.path.name}.'
+            )
+
+            try:
+                with os.fdopen(fd, 'wb') as tmp_file:
+                    tmp_file.write(payload)
+
+                os.replace(tmp, self.path)
+            except BaseException:
+                os.unlink(tmp)
+                raise
+        except OSError:
+            pass
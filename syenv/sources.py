@@ -0,0 +1,180 @@
+from __future__ import annotations
+from abc import ABC, abstractmethod
+import mmap
+import os
+import re
+from pathlib import Path
+from syenv.exceptions import SysenvError
+from typing import Dict, Mapping, Match, Pattern, Union
+
+_QUOTES: bytes = b'"\''
+_LINE_PATTERN: Pattern = re.compile(
+    rb'^[ \t]*(?:export[ \t]+)?(?P<key>[^=\s#]+)[ \t]*=[ \t]*'
+    rb'(?:"(?P<double>(?:[^"\\]|\\.)*)"'
+    rb"|'(?P<single>[^']*)'"
+    rb'|(?P<raw>[^\n]*?))'
+    rb'(?:[ \t]+#[^\n]*)?[ \t\r]*$',
+    re.MULTILINE,
+)
+_ESCAPED_PATTERN: Pattern = re.compile(rb'\\(["\\])')
+
+
+class Source(ABC):
+    """The Source class definition.
+    The base class of the places the raw variables are selected from.
+    """
+
+    @abstractmethod
+    def select(self, prefix: str) -> Dict[str, str]:
+        """Get the raw variables which keys starts with the prefix.
+        The prefix is a plain string, not a pattern.
+
+        Args:
+            prefix (str): The variables prefix.
+
+        Returns:
+            Dict[str, str]: The raw variables.
+        """
+
+
+class MappingSource(Source):
+    """The MappingSource class definition.
+    Select the raw variables from a mapping, read at each selection.
+
+    Attributes:
+        mapping (Mapping[str, str]): The variables.
+    """
+
+    def __init__(self, mapping: Mapping[str, str]) -> None:
+        """The MappingSource class constructor.
+
+        Args:
+            mapping (Mapping[str, str]): The variables.
+        """
+
+        self.mapping: Mapping[str, str] = mapping
+
+    def select(self, prefix: str) -> Dict[str, str]:
+        """Get the raw variables which keys starts with the prefix.
+
+        Args:
+            prefix (str): The variables prefix.
+
+        Returns:
+            Dict[str, str]: The raw variables.
+        """
+
+        return {
+            key: val
+            for key, val in self.mapping.items()
+            if key.startswith(prefix)
+        }
+
+
+class EnvironSource(MappingSource):
+    """The EnvironSource class definition.
+    Select the raw variables from the process environment.
+    This is the default source of Syenv.
+    """
+
+    def __init__(self) -> None:
+        """The EnvironSource class constructor."""
+
+        super().__init__(os.environ)
+
+
+class EnvFileSource(Source):
+    """The EnvFileSource class definition.
+    Select the raw variables from a KEY=VALUE file (like a .env file),
+    without going through the process environment.
+
+    The file is memory-mapped and scanned as bytes, the quoted values
+    being skipped over whole whatever the prefix, and only the lines
+    of the prefixed keys are ever decoded.
+
+    Notes:
+        The blank lines and the comments are ignored. An unquoted value
+        ends at the first "#" preceded by a space. The lines can start
+        with "export", and the values can be wrapped with single or double
+        quotes (then span many lines). In double quotes, a double quote
+        or a backslash is escaped with a backslash.
+        There is no shell expansion: use the Syenv interpolation instead.
+
+    Attributes:
+        path (Path): The file path.
+        encoding (str): The file encoding.
+    """
+
+    def __init__(
+        self, path: Union[str, Path], encoding: str = 'utf-8'
+    ) -> None:
+        """The EnvFileSource class constructor.
+
+        Args:
+            path (Union[str, Path]): The file path.
+            encoding (str, optional): The file encoding.
+                Default to 'utf-8'.
+        """
+
+        self.path: Path = Path(path)
+        self.encoding: str = encoding
+
+    def select(self, prefix: str) -> Dict[str, str]:
+        """Get the raw variables which keys starts with the prefix.
+        When a key is defined many times, the last definition wins.
+
+        Args:
+            prefix (str): The variables prefix.
+
+        Raises:
+            SysenvError: If a value has an unterminated quote.
+
+        Returns:
+            Dict[str, str]: The raw variables, in file order.
+        """
+
+        selected: Dict[str, str] = {}
+        encoded: bytes = prefix.encode(self.encoding)
+
+        with self.path.open('rb') as env_file:
+            if not os.fstat(env_file.fileno()).st_size:
+                return selected
+
+            with mmap.mmap(
+                env_file.fileno(), 0, access=mmap.ACCESS_READ
+            ) as content:
+                for match in _LINE_PATTERN.finditer(content):
+                    if match['key'].startswith(encoded):
+                        selected[match['key'].decode(self.encoding)] = (
+                            self._value(match).decode(self.encoding)
+                        )
+
+        return selected
+
+    @staticmethod
+    def _value(match: Match) -> bytes:
+        """Get the value of a matched line, without its quotes.
+
+        Args:
+            match (Match): The line match.
+
+        Raises:
+            SysenvError: If the value has an unterminated quote.
+
+        Returns:
+            bytes: The value.
+        """
+
+        if match['double'] is not None:
+            return _ESCAPED_PATTERN.sub(rb'\1', match['double'])
+
+        if match['single'] is not None:
+            return match['single']
+
+        if match['raw'][:1] and match['raw'][0] in _QUOTES:
+            raise SysenvError(
+                f'The value of "{match["key"].decode(errors="replace")}" '
+                f'has an unterminated quote.'
+            )
+
+        return match['raw']
@@ -0,0 +1,145 @@
+from __future__ import annotations
+import threading
+from typing import Callable, Dict, List, Optional, Tuple
+
+Callback = Callable[[str, str, float], None]
+
+
+class LoadStats:
+    """The LoadStats class definition.
+    Collect the timings and the counters of the Syenv objects it is
+    given to.
+
+    Exemples:
+        stats = LoadStats()
+        stats.add_callback(lambda stage, name, elapsed: print(stage, name))
+        env = Syenv('MY_APP_', stats=stats)
+        stats.slowest(1)
+        >>> [('STUFF_STORAGE', 0.0012)]
+
+    Attributes:
+        timings (Dict[str, Dict[str, float]]): The seconds spent per
+            attribute name and per stage ('interpolate', 'parse').
+        loads (Dict[str, float]): The seconds spent per prefix to load
+            or reload the variables.
+        depths (Dict[str, int]): The interpolation depth per attribute
+            name, 0 for the variables which interpolate nothing.
+        resolutions (int): The number of converters resolved.
+        cache_hits (int): The converters served without locating them.
+        cache_misses (int): The converters located from a dotted path.
+        current (Optional[str]): The attribute name being resolved by
+            the current thread.
+    """
+
+    def __init__(self, callbacks: Optional[List[Callback]] = None) -> None:
+        """The LoadStats class constructor.
+
+        Args:
+            callbacks (Optional[List[Callback]], optional): The callables
+                called with the stage, the name and the elapsed seconds of
+                each measure. Default to None.
+        """
+
+        self.timings: Dict[str, Dict[str, float]] = {}
+        self.loads: Dict[str, float] = {}
+        self.depths: Dict[str, int] = {}
+        self.resolutions: int = 0
+        self.cache_hits: int = 0
+        self.cache_misses: int = 0
+        self._local: threading.local = threading.local()
+        self._callbacks: List[Callback] = list(callbacks or [])
+
+    @property
+    def current(self) -> Optional[str]:
+        """Return the attribute name being resolved by the current thread.
+
+        Returns:
+            Optional[str]: The attribute name.
+        """
+
+        return getattr(self._local, 'current', None)
+
+    @current.setter
+    def current(self, name: Optional[str]) -> None:
+        """Set the attribute name being resolved by the current thread.
+
+        Args:
+            name (Optional[str]): The attribute name.
+        """
+
+        self._local.current = name
+
+    def add_callback(self, callback: Callback) -> None:
+        """Register a callable called on each measure.
+
+        Args:
+            callback (Callback): The callable, which takes the stage,
+                the name and the elapsed seconds.
+        """
+
+        self._callbacks.append(callback)
+
+    def record(self, stage: str, elapsed: float) -> None:
+        """Record the time spent by the current variable in a stage.
+
+        Args:
+            stage (str): The stage name.
+            elapsed (float): The seconds spent.
+        """
+
+        name: str = self.current or ''
+        stages: Dict[str, float] = self.timings.setdefault(name, {})
+        stages[stage] = stages.get(stage, 0.0) + elapsed
+
+        for callback in self._callbacks:
+            callback(stage, name, elapsed)
+
+    def record_load(self, stage: str, prefix: str, elapsed: float) -> None:
+        """Record the time spent to load the variables of a prefix.
+
+        Args:
+            stage (str): The stage name ('load', 'reload').
+            prefix (str): The variables prefix.
+            elapsed (float): The seconds spent.
+        """
+
+        self.loads[prefix] = self.loads.get(prefix, 0.0) + elapsed
+
+        for callback in self._callbacks:
+            callback(stage, prefix, elapsed)
+
+    def record_resolution(self, located: bool) -> None:
+        """Count a converter resolution.
+
+        Args:
+            located (bool): Indicate if the converter had to be located
+                from its dotted path.
+        """
+
+        self.resolutions += 1
+
+        if located:
+            self.cache_misses += 1
+        else:
+            self.cache_hits += 1
+
+    def slowest(self, count: int = 10) -> List[Tuple[str, float]]:
+        """Get the variables which took the most time to resolve.
+
+        Args:
+            count (int, optional): The number of variables to return.
+                Default to 10.
+
+        Returns:
+            List[Tuple[str, float]]: The attributes names and their total
+                seconds, slowest first.
+        """
+
+        return sorted(
+            (
+                (name, sum(stages.values()))
+                for name, stages in self.timings.items()
+            ),
+            key=lambda item: item[1],
+            reverse=True,
+        )[:count]
@@ -1,9 +1,280 @@
 from __future__ import annotations
-import os
+import asyncio
+from collections import ChainMap
+from concurrent.futures import Executor, FIRST_COMPLETED, Future, wait
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import lru_cache
+import inspect
 import re
-from pydoc import locate
-from syenv.exceptions import SysenvError
-from typing import Any, Dict, Generator, List
+import sys
+import threading
+from time import perf_counter
+import warnings
+from syenv.converters import ConverterRegistry, default_registry
+from syenv.exceptions import ConverterError, SysenvError
+from syenv.snapshot import SnapshotCache
+from syenv.sources import EnvironSource, Source
+from syenv.stats import LoadStats
+from syenv.interpolation import (
+    INTERP_REGEX,
+    compile_template,
+    resolution_order,
+)
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    FrozenSet,
+    Generator,
+    Iterator,
+    List,
+    Mapping,
+    MutableMapping,
+    NamedTuple,
+    Optional,
+    Set,
+    Tuple,
+)
+from types import MappingProxyType
+
+if TYPE_CHECKING:
+    from syenv.loader import EnvIndex
+
+
+_MATCHERS_CACHE_SIZE: int = 256
+_MISSING: Any = object()
+_SLOTS: Tuple[str, ...] = (
+    '_prefix',
+    '_type_separator',
+    '_keep_prefix',
+    '_converters',
+    '_source',
+    '_lazy',
+    '_stats',
+    '_snapshot',
+    '_executor',
+    '_raw',
+    '_pending',
+    '_dependents',
+    '_selections',
+    '_staged',
+    '_shared',
+    '_resolved',
+    '_lock',
+)
+_INTERNALS: FrozenSet[str] = frozenset((*_SLOTS, '_store'))
+_DEFERRED: ContextVar[Optional[type]] = ContextVar('_DEFERRED', default=None)
+
+
+@lru_cache(maxsize=_MATCHERS_CACHE_SIZE)
+def _matcher(pattern: str) -> Callable[[str], bool]:
+    """Get a predicate searching the pattern in a string.
+    The literal patterns are searched as substrings, the others are
+    compiled as regular expressions.
+
+    Args:
+        pattern (str): The pattern to search.
+
+    Returns:
+        Callable[[str], bool]: The predicate.
+    """
+
+    if re.escape(pattern) == pattern:
+        return lambda val: pattern in val
+
+    search: Callable[[str], Any] = re.compile(pattern).search
+    return lambda val: search(val) is not None
+
+
+def _select(
+    items: Mapping[str, Any],
+    pattern: str,
+    keep_pattern: bool = False,
+    to_lower: bool = False,
+) -> Dict[str, Any]:
+    """Get the variables which names matches with the pattern.
+
+    Args:
+        items (Mapping[str, Any]): The variables. Only the values of the
+            matching names are read.
+        pattern (str): The string to search in the names.
+        keep_pattern (bool, optional): Specify if the pattern should be
+            kept in the names. Default to False.
+        to_lower (bool, optional): Specify if the names should be forced
+            in lower case. Default to False.
+
+    Returns:
+        Dict[str, Any]: The variables matched.
+    """
+
+    selected: Dict[str, Any] = {}
+    match: Callable[[str], bool] = _matcher(pattern)
+
+    for k in list(items):
+        if match(k):
+            v: Any = items[k]
+            k = k.lower() if to_lower else k
+            k = k if keep_pattern else k.replace(pattern, '')
+            selected[k] = v
+
+    return selected
+
+
+def _fold_index(
+    index: Optional[EnvIndex], source: Optional[Source]
+) -> Optional[Source]:
+    """Fold the deprecated index parameter into the source one,
+    an EnvIndex being a source.
+
+    Args:
+        index (Optional[EnvIndex]): The index parameter.
+        source (Optional[Source]): The source parameter.
+
+    Returns:
+        Optional[Source]: The source to use.
+    """
+
+    if index is None:
+        return source
+
+    warnings.warn(
+        'The "index" parameter is deprecated, '
+        'pass the EnvIndex as the "source" instead.',
+        DeprecationWarning,
+        stacklevel=3,
+    )
+    return source if source is not None else index
+
+
+class ChangeSet(NamedTuple):
+    """The ChangeSet class definition.
+    The attributes names touched by a reload.
+
+    Attributes:
+        added (Tuple[str, ...]): The variables which appeared.
+        changed (Tuple[str, ...]): The variables which raw value changed.
+        removed (Tuple[str, ...]): The variables which disappeared.
+        dependents (Tuple[str, ...]): The unchanged variables re-resolved
+            because they interpolate a touched one.
+    """
+
+    added: Tuple[str, ...] = ()
+    changed: Tuple[str, ...] = ()
+    removed: Tuple[str, ...] = ()
+    dependents: Tuple[str, ...] = ()
+
+
+class PinnedSyenv:
+    """The PinnedSyenv class definition.
+    A read-only version of the variables of a Syenv object, which stays
+    consistent while the object is reloaded or mutated.
+
+    Exemples:
+        conf = env.pin()
+        conf.FTPS_PARAM_HOST, conf.FTPS_PARAM_PORT
+        >>> ('hostname', 22)
+
+    Notes:
+        Only the variables (and the public attributes) are pinned, not the
+        properties of the class.
+
+    Attributes:
+        as_dict (Dict[str, Any]): The variables as dict format.
+        as_mapping (MappingProxyType): A read-only view of the variables.
+    """
+
+    __slots__ = ('_store',)
+
+    def __init__(self, store: Dict[str, Any]) -> None:
+        """The PinnedSyenv class constructor.
+
+        Args:
+            store (Dict[str, Any]): A published store, never mutated.
+        """
+
+        object.__setattr__(self, '_store', store)
+
+    @property
+    def as_dict(self) -> Dict[str, Any]:
+        """Return the variables in dict format.
+
+        Returns:
+            Dict[str, Any]: The variables.
+        """
+
+        return dict(self._store)
+
+    @property
+    def as_mapping(self) -> MappingProxyType:
+        """Return a read-only view of the variables.
+
+        Returns:
+            MappingProxyType: The variables view.
+        """
+
+        return MappingProxyType(self._store)
+
+    def from_pattern(
+        self, pattern: str, keep_pattern: bool = False, to_lower: bool = False
+    ) -> Dict[str, Any]:
+        """Get the variables which names matches with the pattern
+        passed in parameter, like Syenv.from_pattern.
+
+        Args:
+            pattern (str): The string to search in attributes.
+            keep_pattern (bool, optional): Specify if the pattern should be
+                returned as the name of the variable name. Default to False.
+            to_lower (bool, optional): Specify if the key should be forced
+                in lower case. Default to False.
+
+        Returns:
+            Dict[str, Any]: The attributes matched.
+        """
+
+        return _select(self._store, pattern, keep_pattern, to_lower)
+
+    def __getattr__(self, name: str) -> Any:
+        """Get a variable as an attribute.
+
+        Raises:
+            AttributeError: If the variable doesn't exists.
+        """
+
+        if name != '_store' and not name.startswith('__'):
+            try:
+                return self._store[name]
+            except KeyError:
+                pass
+
+        raise AttributeError(
+            f'\'{type(self).__name__}\' object has no attribute \'{name}\''
+        )
+
+    def __setattr__(self, name: str, val: Any) -> None:
+        """Forbid to set the variables.
+
+        Raises:
+            SysenvError: Always.
+        """
+
+        raise SysenvError(f'The pinned variable "{name}" is read-only.')
+
+    def __contains__(self, key: str) -> bool:
+        """Check if a variable exists."""
+
+        return key in self._store
+
+    def __len__(self) -> int:
+        """Get the number of variables."""
+
+        return len(self._store)
+
+    def __iter__(self) -> Generator:
+        """Iterate over the variables names and values."""
+
+        yield from self._store.items()
 
 
 class Syenv:
@@ -11,14 +282,66 @@ class Syenv:
     Load the environment variables which contains the prefix (if needed)
     and auto hydrate itself with the variables retrieved.
 
+    Notes:
+        The variables (and any public attribute set on the object) are
+        held in the instance __dict__, so they are read by the attribute
+        lookup itself, and the internals in slots.
+
+        The mapping is copy-on-write: the loads and reloads are staged
+        in a copy, then published at once by swapping the reference. So
+        the variables are read without any lock, and never half-updated by
+        a concurrent load or reload (the writers are serialized). The lazy
+        resolutions and the assignments are staged apart, then merged in
+        place (unless the mapping is pinned), without copying it.
+
     Attributes:
         as_dict (Dict[str, Any]): The imported variables as dict format.
+        as_mapping (MappingProxyType): A read-only view of the variables.
     """
 
-    _INTERP_REGEX: str = r'{{(\w+)}}'
+    __slots__ = (*_SLOTS, '__dict__')
+
+    _INTERP_REGEX: str = INTERP_REGEX
     _DEFAULT_TYPE_SEP: str = '::'
     _DEFAULT_KEEP_PREFIX: bool = False
-    _SKIPED_ATTR: List[str] = ['_prefix', '_type_separator', '_keep_prefix']
+    _DEFAULT_LAZY: bool = False
+
+    def __new__(cls, *args: Any, **kwargs: Any) -> Syenv:
+        """Create the variables store before any attribute is set,
+        so the subclasses can set their own attributes before calling
+        the Syenv constructor."""
+
+        self: Syenv = super().__new__(cls)
+        self._store: Dict[str, Any] = {}
+        self._staged: Optional[MutableMapping[str, Any]] = None
+        self._shared: bool = False
+        self._resolved: Dict[str, str] = {}
+        self._lock: threading.RLock = threading.RLock()
+        self._raw: Dict[str, str] = {}
+        self._pending: Dict[str, str] = {}
+        self._dependents: Dict[str, Set[str]] = {}
+        self._selections: Dict[Tuple[str, bool, bool], Dict[str, Any]] = {}
+        return self
+
+    @property
+    def _store(self) -> Dict[str, Any]:
+        """Return the published variables, held as the instance __dict__.
+
+        Returns:
+            Dict[str, Any]: The variables store.
+        """
+
+        return object.__getattribute__(self, '__dict__')
+
+    @_store.setter
+    def _store(self, store: Dict[str, Any]) -> None:
+        """Publish a variables store by swapping the instance __dict__.
+
+        Args:
+            store (Dict[str, Any]): The new store.
+        """
+
+        object.__setattr__(self, '__dict__', store)
 
     def __init__(
         self,
@@ -26,6 +349,13 @@ class Syenv:
         *,
         type_separator: str = _DEFAULT_TYPE_SEP,
         keep_prefix: bool = _DEFAULT_KEEP_PREFIX,
+        converters: Optional[ConverterRegistry] = None,
+        index: Optional[EnvIndex] = None,
+        source: Optional[Source] = None,
+        lazy: bool = _DEFAULT_LAZY,
+        stats: Optional[LoadStats] = None,
+        snapshot: Optional[SnapshotCache] = None,
+        executor: Optional[Executor] = None,
     ) -> None:
         """The Syenv class constructor.
         Hydrate the object with the variables retrieved.
@@ -38,13 +368,88 @@ class Syenv:
             keep_prefix (bool, optional): Indicate if Syenv should keep this
                 prefix for its attributes name.
                 Default to Syenv._DEFAULT_KEEP_PREFIX.
+            converters (Optional[ConverterRegistry], optional): The registry
+                used to resolve the types names.
+                Default to syenv.converters.default_registry.
+            index (Optional[EnvIndex], optional): Deprecated, an EnvIndex
+                is passed as the source. Default to None.
+            source (Optional[Source], optional): The source to select the
+                variables from (a shared EnvIndex, a mapping, a .env
+                file...), instead of os.environ. Default to None.
+            lazy (bool, optional): Indicate if the variables should be
+                resolved on their first access instead of during the
+                construction. Default to Syenv._DEFAULT_LAZY.
+            stats (Optional[LoadStats], optional): The collector of the
+                loading timings and counters. Default to None.
+            snapshot (Optional[SnapshotCache], optional): The on-disk cache
+                of the resolved variables, used when the environment
+                didn't change since it was written. Default to None.
+            executor (Optional[Executor], optional): The executor (like a
+                ThreadPoolExecutor) used to resolve the independent
+                variables concurrently. Their converters must be
+                thread-safe. Default to None.
         """
 
         self._prefix: str = prefix
         self._type_separator: str = type_separator
         self._keep_prefix: bool = keep_prefix
+        self._converters: ConverterRegistry = (
+            converters if converters is not None else default_registry
+        )
+        source = _fold_index(index, source)
+        self._source: Source = (
+            source if source is not None else EnvironSource()
+        )
+        if _DEFERRED.get() is type(self):
+            _DEFERRED.set(None)
+            lazy = True
+
+        self._lazy: bool = lazy
+        self._stats: Optional[LoadStats] = stats
+        self._snapshot: Optional[SnapshotCache] = snapshot
+        self._executor: Optional[Executor] = executor
+        self._raw: Dict[str, str] = {}
+        self._dependents: Dict[str, Set[str]] = {}
         self._loadenv()
 
+    @classmethod
+    async def aload(cls, *args: Any, **kwargs: Any) -> Syenv:
+        """The asynchronous Syenv constructor.
+        The variables are resolved as concurrent asyncio tasks, each one
+        starting once the variables it interpolates are resolved, and the
+        coroutines returned by the converters are awaited.
+
+        Exemples:
+            env = await Syenv.aload('MY_APP_')
+            conf = await Config.aload()
+
+        Notes:
+            The object is built with the constructor of the class, so the
+            subclasses with their own constructor are supported. Its
+            variables are deferred (like in lazy mode) while it runs.
+
+        Args:
+            *args (Any): The constructor positional parameters.
+            **kwargs (Any): The constructor keyword parameters.
+
+        Raises:
+            SysenvError: If some variables interpolate each other.
+
+        Returns:
+            Syenv: The hydrated object.
+        """
+
+        token: Any = _DEFERRED.set(cls)
+
+        try:
+            env: Syenv = cls(*args, **kwargs)
+        finally:
+            _DEFERRED.reset(token)
+
+        await env._aresolve(list(env._pending))
+        env._lazy = False
+        return env
+
     @property
     def as_dict(self) -> Dict[str, Any]:
         """Return all mutated variables in dict format.
@@ -53,7 +458,37 @@ class Syenv:
             Dict[str, Any]: The formated variables.
         """
 
-        return {k: v for k, v in self.__iter__()}
+        if self._pending:
+            self._resolve(list(self._pending))
+
+        return dict(self._store)
+
+    @property
+    def as_mapping(self) -> MappingProxyType:
+        """Return a read-only view of the variables, without copying them.
+
+        Returns:
+            MappingProxyType: The variables view.
+        """
+
+        if self._pending:
+            self._resolve(list(self._pending))
+
+        return MappingProxyType(self._share())
+
+    def pin(self) -> PinnedSyenv:
+        """Get the current version of the variables, which stays
+        consistent while the object is reloaded (for example during
+        a whole request). The pending variables are resolved first.
+
+        Returns:
+            PinnedSyenv: The read-only version.
+        """
+
+        if self._pending:
+            self._resolve(list(self._pending))
+
+        return PinnedSyenv(self._share())
 
     def from_pattern(
         self, pattern: str, keep_pattern: bool = False, to_lower: bool = False
@@ -68,38 +503,482 @@ class Syenv:
             to_lower (bool, optional): Specify if the key should be forced
                 in lower case. Default to False.
 
+        Notes:
+            The selections are memoized until the variables change.
+
         Returns:
             Dict[str, Ant]: The attributes matched.
         """
-        selected: Dict[str, Any] = {}
 
-        for k, v in self.as_dict.items():
-            if re.search(pattern, k):
-                k = k.lower() if to_lower else k
-                k = k if keep_pattern else k.replace(pattern, '')
-                selected[k] = v
+        selection: Tuple[str, bool, bool] = (pattern, keep_pattern, to_lower)
+
+        if (selected := self._selections.get(selection)) is not None:
+            return dict(selected)
+
+        if self._pending:
+            match: Callable[[str], bool] = _matcher(pattern)
+            self._resolve(
+                [name for name in list(self._pending) if match(name)]
+            )
+
+        selections: Dict[Tuple[str, bool, bool], Dict[str, Any]] = (
+            self._selections
+        )
+        selected = _select(self._store, pattern, keep_pattern, to_lower)
+        selections[selection] = selected
+        return dict(selected)
+
+    def reload(
+        self,
+        index: Optional[EnvIndex] = None,
+        source: Optional[Source] = None,
+    ) -> ChangeSet:
+        """Refresh the variables from the environment.
+        Only the added, changed and removed variables, and the variables
+        interpolating them, are resolved again.
+
+        Args:
+            index (Optional[EnvIndex], optional): Deprecated, an EnvIndex
+                is passed as the source. Default to None.
+            source (Optional[Source], optional): A new source to select the
+                variables from. Without it, the source given to the
+                constructor is reused as is (so a given EnvIndex is not
+                refreshed). Default to None.
+
+        Notes:
+            The new variables are published at once when the reload
+            succeeds. On error, the previous variables are kept.
+
+        Raises:
+            SysenvError: If an interpolated variable doesn't exists anymore,
+                if some variables interpolate each other or if a variable
+                to resolve has an asynchronous converter (the objects
+                loaded with Syenv.aload are reloaded by loading them again).
+
+        Returns:
+            ChangeSet: The attributes names touched by the reload.
+        """
+
+        if (source := _fold_index(index, source)) is not None:
+            self._source = source
+
+        start: float = perf_counter()
+
+        with self._staging() as store:
+            old: Dict[str, str] = self._raw
+            new: Dict[str, str] = self._select()
+            added: List[str] = [key for key in new if key not in old]
+            removed: List[str] = [key for key in old if key not in new]
+            changed: List[str] = [
+                key for key in new if key in old and new[key] != old[key]
+            ]
+            touched: Set[str] = {*added, *removed, *changed}
+            affected: Set[str] = set(touched)
+            stack: List[str] = list(touched)
+
+            while stack:
+                for dependent in self._dependents.get(stack.pop(), ()):
+                    if dependent not in affected:
+                        affected.add(dependent)
+                        stack.append(dependent)
+
+            self._pending = dict(self._pending)
+            self._dependents = {
+                key: set(dependents)
+                for key, dependents in self._dependents.items()
+            }
 
-        return selected
+            for env_key in (*removed, *changed):
+                self._unlink(env_key, old[env_key])
+
+            for env_key in (*added, *changed):
+                self._link(env_key, new[env_key])
+
+            self._raw = new
+
+            for env_key in affected:
+                name: str = self._attr_name(env_key)
+                store.pop(name, None)
+                self._pending.pop(name, None)
+
+                if env_key in new:
+                    self._pending[name] = env_key
+
+            if not self._lazy:
+                self._resolve(list(self._pending))
+
+        if self._stats is not None:
+            self._stats.record_load(
+                'reload', self._prefix, perf_counter() - start
+            )
+
+        return ChangeSet(
+            *(
+                tuple(self._attr_name(key) for key in keys)
+                for keys in (
+                    added,
+                    changed,
+                    removed,
+                    [key for key in new if key in affected - touched],
+                )
+            )
+        )
 
     def _loadenv(self) -> None:
         """Hydrate the Syenv object with the environment variables
         retrieved.
+        The variables are resolved in the order of their interpolations
+        dependencies, so a variable can interpolate another one
+        defined after it.
 
         Notes:
             The prefix of all environment variables
             is suppressed during the mutation.
+
+            With a snapshot cache, the variables are loaded from it if
+            it matches, otherwise it is rewritten after the resolution
+            (except in lazy mode, where nothing is resolved yet).
+
+        Raises:
+            SysenvError: If some variables interpolate each other.
         """
 
-        for env_key in os.environ.keys():
-            if re.match(r'^%s' % self._prefix, env_key):
-                setattr(
-                    self,
-                    env_key
-                    if self._keep_prefix
-                    else self._sub_prefix(env_key),
-                    self._interpolate(os.environ[env_key]),
+        start: float = perf_counter()
+
+        with self._staging() as store:
+            self._raw = self._select()
+            self._pending = {
+                self._attr_name(env_key): env_key
+                for env_key in self._raw.keys()
+            }
+            self._dependents = {}
+
+            for env_key, env_val in self._raw.items():
+                self._link(env_key, env_val)
+
+            stale_key: Optional[str] = None
+
+            if self._snapshot is not None:
+                snapshot_key: str = self._snapshot.key(
+                    self._raw,
+                    self._prefix,
+                    self._type_separator,
+                    self._keep_prefix,
+                    self._converters,
                 )
 
+                if not self._restore(snapshot_key):
+                    stale_key = snapshot_key
+
+            if not self._lazy:
+                self._resolve(list(self._pending))
+
+                if stale_key is not None:
+                    names: List[str] = [
+                        self._attr_name(env_key) for env_key in self._raw
+                    ]
+                    self._snapshot.save(
+                        stale_key, {name: store[name] for name in names}
+                    )
+
+        if self._stats is not None:
+            self._stats.record_load(
+                'load', self._prefix, perf_counter() - start
+            )
+
+    def _restore(self, snapshot_key: str) -> bool:
+        """Hydrate the pending variables from the snapshot cache
+        if it matches with the key.
+        The values missing from the snapshot stay pending.
+
+        Args:
+            snapshot_key (str): The key of the current resolution.
+
+        Returns:
+            bool: True if the snapshot matched.
+        """
+
+        if (values := self._snapshot.load(snapshot_key)) is None:
+            return False
+
+        for name, val in values.items():
+            if name in self._pending:
+                self._assign(name, val)
+                self._settle(name)
+
+        return True
+
+    def _select(self) -> Dict[str, str]:
+        """Get the raw environment variables which keys starts
+        with the prefix.
+
+        Returns:
+            Dict[str, str]: The raw variables.
+        """
+
+        return self._source.select(self._prefix)
+
+    def _link(self, env_key: str, env_val: str) -> None:
+        """Register a variable as a dependent of the keys it interpolates.
+
+        Args:
+            env_key (str): The variable key.
+            env_val (str): The variable raw value.
+        """
+
+        for key in compile_template(env_val).keys:
+            self._dependents.setdefault(key, set()).add(env_key)
+
+    def _unlink(self, env_key: str, env_val: str) -> None:
+        """Unregister a variable from the keys it interpolated.
+
+        Args:
+            env_key (str): The variable key.
+            env_val (str): The variable previous raw value.
+        """
+
+        for key in compile_template(env_val).keys:
+            self._dependents.get(key, set()).discard(env_key)
+
+    def _resolve(self, names: List[str]) -> None:
+        """Resolve some pending variables, with the pending variables
+        they interpolate, in the order of their dependencies.
+        With an executor, the independent variables are resolved
+        concurrently. The variables resolved by another thread meanwhile
+        are skipped.
+
+        Args:
+            names (List[str]): The attributes names to resolve.
+
+        Raises:
+            SysenvError: If some variables interpolate each other, or have
+                an asynchronous converter.
+        """
+
+        with self._staging(in_place=True):
+            graph: Dict[str, Tuple[str, ...]] = self._pending_graph(names)
+            order: List[str] = self._resolution_order(graph)
+
+            if self._executor is not None and len(order) > 1:
+                self._resolve_concurrently(graph, order)
+                return
+
+            for env_key in order:
+                name: str = self._attr_name(env_key)
+                self._assign(
+                    name,
+                    self._synchronous(env_key, self._resolve_one(env_key)),
+                )
+                self._settle(name)
+
+    def _resolve_concurrently(
+        self, graph: Dict[str, Tuple[str, ...]], order: List[str]
+    ) -> None:
+        """Resolve the variables on the executor, each one being submitted
+        once the variables it interpolates are resolved.
+        The values are assigned from the calling thread.
+
+        Args:
+            graph (Dict[str, Tuple[str, ...]]): The interpolated keys of
+                the variables to resolve.
+            order (List[str]): The variables in resolution order.
+        """
+
+        waiting: Dict[str, int] = {}
+        dependents: Dict[str, List[str]] = {}
+
+        for env_key in order:
+            deps: Set[str] = {key for key in graph[env_key] if key in graph}
+            waiting[env_key] = len(deps)
+
+            for dep in deps:
+                dependents.setdefault(dep, []).append(env_key)
+
+        running: Dict[Future, str] = {
+            self._executor.submit(self._resolve_one, env_key): env_key
+            for env_key in order
+            if not waiting[env_key]
+        }
+
+        try:
+            while running:
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+
+                for future in done:
+                    env_key: str = running.pop(future)
+                    name: str = self._attr_name(env_key)
+                    self._assign(
+                        name, self._synchronous(env_key, future.result())
+                    )
+                    self._settle(name)
+
+                    for dependent in dependents.get(env_key, ()):
+                        waiting[dependent] -= 1
+
+                        if not waiting[dependent]:
+                            running[
+                                self._executor.submit(
+                                    self._resolve_one, dependent
+                                )
+                            ] = dependent
+        finally:
+            for future in running:
+                future.cancel()
+
+    async def _aresolve(self, names: List[str]) -> None:
+        """Resolve some pending variables as asyncio tasks, each one
+        awaiting the variables it interpolates. The awaitable values
+        returned by the converters are awaited.
+
+        Args:
+            names (List[str]): The attributes names to resolve.
+
+        Raises:
+            SysenvError: If some variables interpolate each other.
+        """
+
+        tasks: Dict[str, asyncio.Future] = {}
+
+        async def resolve(env_key: str, deps: List[asyncio.Future]) -> None:
+            await asyncio.gather(*deps)
+            val: Any = self._resolve_one(env_key)
+
+            if inspect.isawaitable(val):
+                val = await val
+
+            self._assign(self._attr_name(env_key), val)
+            self._settle(self._attr_name(env_key))
+
+        with self._staging(in_place=True):
+            graph: Dict[str, Tuple[str, ...]] = self._pending_graph(names)
+
+            for env_key in self._resolution_order(graph):
+                tasks[env_key] = asyncio.ensure_future(
+                    resolve(
+                        env_key,
+                        [
+                            tasks[key]
+                            for key in set(graph[env_key])
+                            if key in tasks
+                        ],
+                    )
+                )
+
+            try:
+                await asyncio.gather(*tasks.values())
+            finally:
+                for task in tasks.values():
+                    task.cancel()
+
+    @staticmethod
+    def _synchronous(env_key: str, val: Any) -> Any:
+        """Check that a variable resolved synchronously is not an
+        awaitable (returned by an asynchronous converter).
+
+        Args:
+            env_key (str): The environment variable key.
+            val (Any): The resolved value.
+
+        Raises:
+            SysenvError: If the value is an awaitable, which is closed.
+
+        Returns:
+            Any: The value.
+        """
+
+        if not inspect.isawaitable(val):
+            return val
+
+        if inspect.iscoroutine(val):
+            val.close()
+
+        raise SysenvError(
+            f'The variable "{env_key}" has an asynchronous converter, '
+            f'it can only be resolved by Syenv.aload.'
+        )
+
+    def _pending_graph(self, names: List[str]) -> Dict[str, Tuple[str, ...]]:
+        """Get the interpolated keys of some pending variables and of the
+        pending variables they interpolate.
+
+        Args:
+            names (List[str]): The attributes names.
+
+        Returns:
+            Dict[str, Tuple[str, ...]]: The interpolated keys by
+                environment variable key.
+        """
+
+        graph: Dict[str, Tuple[str, ...]] = {}
+        stack: List[str] = [
+            self._pending[name] for name in names if name in self._pending
+        ]
+
+        while stack:
+            env_key: str = stack.pop()
+
+            if env_key not in graph:
+                graph[env_key] = compile_template(self._raw[env_key]).keys
+                stack.extend(
+                    key
+                    for key in graph[env_key]
+                    if self._pending.get(self._attr_name(key)) == key
+                )
+
+        return graph
+
+    def _resolution_order(
+        self, graph: Dict[str, Tuple[str, ...]]
+    ) -> List[str]:
+        """Sort the variables in resolution order, recording their
+        interpolation depth in the stats.
+
+        Args:
+            graph (Dict[str, Tuple[str, ...]]): The interpolated keys by
+                environment variable key.
+
+        Raises:
+            SysenvError: If some variables interpolate each other.
+
+        Returns:
+            List[str]: The environment variables keys sorted.
+        """
+
+        order: List[str] = resolution_order(graph)
+
+        if self._stats is not None:
+            for env_key in order:
+                self._stats.depths[self._attr_name(env_key)] = max(
+                    (
+                        self._stats.depths.get(self._attr_name(key), 0) + 1
+                        for key in graph[env_key]
+                    ),
+                    default=0,
+                )
+
+        return order
+
+    def _resolve_one(self, env_key: str) -> Any:
+        """Interpolate and parse a variable whose interpolated variables
+        are resolved.
+
+        Args:
+            env_key (str): The environment variable key.
+
+        Returns:
+            Any: The variable value.
+        """
+
+        if self._stats is None:
+            return self._interpolate(self._raw[env_key])
+
+        self._stats.current = self._attr_name(env_key)
+
+        try:
+            return self._interpolate(self._raw[env_key])
+        finally:
+            self._stats.current = None
+
     def _interpolate(self, val: str) -> str:
         """Trying to replace an interpolated variable string with
         the correct values.
@@ -112,6 +991,10 @@ class Syenv:
             self._interpolate(os.environ['MY_SPECIFIC_VAR'])
             >>> 'hello world!'
 
+        Notes:
+            The value is compiled once to a template (memoized by value),
+            then rendered in a single pass.
+
         Args:
             val (str): The variable value that may contains
                 some interpolations.
@@ -123,28 +1006,63 @@ class Syenv:
             str: The formated variable value.
         """
 
-        if keys := re.findall(self._INTERP_REGEX, val):
-            for key in keys:
-                try:
-                    val = val.replace(
-                        '{{%s}}' % key,
-                        str(
-                            getattr(
-                                self,
-                                key
-                                if self._keep_prefix
-                                else self._sub_prefix(key),
-                            )
-                        ),
-                    )
-                except AttributeError:
-                    raise SysenvError(
-                        f'The interpolated key "{key}" doesn\'t '
-                        f'exists in environment variables, '
-                        f'or it is called before assignement.'
-                    )
+        if self._stats is None:
+            return self._parse(compile_template(val).render(self._lookup))
 
-        return self._parse(val)
+        start: float = perf_counter()
+        rendered: str = compile_template(val).render(self._lookup)
+        self._stats.record('interpolate', perf_counter() - start)
+        return self._parse(rendered)
+
+    def _lookup(self, key: str) -> Any:
+        """Get the value of an interpolated key.
+
+        Args:
+            key (str): The interpolated key.
+
+        Raises:
+            SysenvError: If the interpolated variable doesn't exists.
+
+        Notes:
+            The staged variables are read first, so the variables being
+            resolved can interpolate each other before being published.
+            The other names fall back to the attributes of the class.
+
+        Returns:
+            Any: The variable value.
+        """
+
+        name: str = self._attr_name(key)
+        store: Mapping[str, Any] = (
+            self._staged if self._staged is not None else self._store
+        )
+
+        if (val := store.get(name, _MISSING)) is not _MISSING:
+            return val
+
+        if name not in self._store:
+            try:
+                return object.__getattribute__(self, name)
+            except AttributeError:
+                pass
+
+        raise SysenvError(
+            f'The interpolated key "{key}" doesn\'t '
+            f'exists in environment variables, '
+            f'or it is called before assignement.'
+        )
+
+    def _attr_name(self, key: str) -> str:
+        """Get the attribute name of an environment variable key.
+
+        Args:
+            key (str): The environment variable key.
+
+        Returns:
+            str: The attribute name.
+        """
+
+        return key if self._keep_prefix else self._sub_prefix(key)
 
     def _parse(self, val: str) -> Any:
         """Trying to parse a variable value to the correct
@@ -164,6 +1082,9 @@ class Syenv:
             self._parse('dateutil.parser.parse:2000-01-01')
             >>> datetime.datetime(2000, 01, 01, 0, 0)
 
+            self._parse('tuple[int]::1,2,3')
+            >>> (1, 2, 3)
+
         Notes:
             The parsing string format is compatible with
             the interpolation process.
@@ -176,6 +1097,16 @@ class Syenv:
                 self._pase(os.environ['JS_FILES_PATH'])
                 >>> PosixPath('statics/js')
 
+            The types names are resolved through the converters registry,
+            so each dotted path is only located once.
+
+            Only the first separator splits the type from the value, so the
+            value can contain the separator when the type exists.
+
+            The collections types are written as list[int]::1,2,3,
+            dict[str,int]::a=1,b=2 or array('q')::1,2,3 (see
+            ConverterRegistry).
+
         Args:
             val (str): The environment variable value.
 
@@ -183,25 +1114,56 @@ class Syenv:
             SysenvError: If the type specified dosen't exists
                 or if the variable value passed in the type parameter
                 doesn't match with its requirements.
+            ConverterError: If the type is recognized but can't be built
+                (like an array with an unknown typecode).
 
         Returns:
             Any: The parsed value in the correct type.
         """
 
-        env_parts: List[str] = val.split(self._type_separator)
-        env_type, env_val = (
-            env_parts if len(env_parts) == 2 else ['str', env_parts[0]]
-        )
+        env_type, sep, env_val = val.partition(self._type_separator)
+
+        if not sep or (
+            sep in env_val and not self._converters.exists(env_type)
+        ):
+            env_type, env_val = 'str', val
 
         try:
-            return locate(env_type)(env_val)
-        except TypeError:
+            if self._stats is None:
+                return self._converters.resolve(env_type)(env_val)
+
+            return self._measured_parse(env_type, env_val)
+        except ConverterError:
+            raise
+        except (SysenvError, TypeError):
             raise SysenvError(
                 f'The type "{env_type}" doesn\'t exists, or the argument '
                 f'"{env_val}" doesn\'t matching with the '
                 f'{env_type} parameters.'
             )
 
+    def _measured_parse(self, env_type: str, env_val: str) -> Any:
+        """Convert a value while recording the time spent and the
+        converter resolution in the stats.
+
+        Args:
+            env_type (str): The type name.
+            env_val (str): The value to convert.
+
+        Returns:
+            Any: The converted value.
+        """
+
+        misses: int = self._converters.cache_info.misses
+        start: float = perf_counter()
+        converter: Any = self._converters.resolve(env_type)
+        self._stats.record_resolution(
+            self._converters.cache_info.misses != misses
+        )
+        val: Any = converter(env_val)
+        self._stats.record('parse', perf_counter() - start)
+        return val
+
     def _sub_prefix(self, key: str) -> str:
         """Suppress prefix in the key.
 
@@ -212,11 +1174,202 @@ class Syenv:
             str: The cleaned key.
         """
 
-        return key.replace(self._prefix, '')
+        return (
+            key[len(self._prefix) :] if key.startswith(self._prefix) else key
+        )
+
+    def _assign(self, name: str, val: Any) -> None:
+        """Set a variable in the staged store (published at once if
+        nothing is being staged).
+        The names bound to a data descriptor of the class (the slots, the
+        properties) are set through it instead.
+
+        Notes:
+            Outside of a stage, a single assignment can't fail halfway,
+            so it is written directly to the store (unless it is shared).
+
+        Args:
+            name (str): The attribute name.
+            val (Any): The value.
+        """
+
+        attr: Any = getattr(type(self), name, _MISSING)
+
+        if hasattr(attr, '__set__'):
+            object.__setattr__(self, name, val)
+            return
+
+        with self._lock:
+            if self._staged is None and not self._shared:
+                self._store[sys.intern(name)] = val
+                self._selections = {}
+                return
+
+            with self._staging(in_place=True) as store:
+                store[sys.intern(name)] = val
+
+    def _settle(self, name: str) -> None:
+        """Remove a resolved variable from the pending ones, keeping it
+        to be restored if the stage fails.
+
+        Args:
+            name (str): The attribute name.
+        """
+
+        self._resolved[name] = self._pending.pop(name)
+
+    def _share(self) -> Dict[str, Any]:
+        """Get the published store to hand it out, so it is never
+        mutated in place anymore.
+
+        Returns:
+            Dict[str, Any]: The published store.
+        """
+
+        with self._lock:
+            self._shared = True
+            return self._store
+
+    @contextmanager
+    def _staging(self, in_place: bool = False) -> Iterator[Any]:
+        """Stage the changes of the variables, published when the
+        outermost stage succeeds. The nested stages share the same one.
+
+        By default, the changes are staged in a copy of the store,
+        published by swapping the store reference. In place, they are
+        staged in a batch layered over the store, then merged into it,
+        so only the changed variables are copied (unless the store was
+        handed out by a pin or a view).
+
+        Notes:
+            The writers are serialized by a reentrant lock, the readers
+            only read the published store. On error, the staged changes
+            are dropped, the raw, pending and dependents variables are
+            restored (so the loads and reloads replace them instead of
+            mutating them) and the variables resolved meanwhile are
+            pending again.
+
+            Once they are all resolved, the pending variables are
+            replaced by an empty mapping, releasing their table.
+
+        Args:
+            in_place (bool, optional): Indicate if the changes can be
+                merged into the store. Default to False.
+
+        Yields:
+            MutableMapping[str, Any]: The staged store.
+        """
+
+        with self._lock:
+            if self._staged is not None:
+                yield self._staged
+                return
+
+            in_place = in_place and not self._shared
+            raw: Dict[str, str] = self._raw
+            pending: Dict[str, str] = self._pending
+            dependents: Dict[str, Set[str]] = self._dependents
+            batch: Dict[str, Any] = {}
+            self._staged = (
+                ChainMap(batch, self._store) if in_place else dict(self._store)
+            )
+
+            try:
+                yield self._staged
+
+                if in_place:
+                    self._store.update(batch)
+                else:
+                    self._store = self._staged
+                    self._shared = False
+
+                self._selections = {}
+
+                if not self._pending:
+                    self._pending = {}
+            except BaseException:
+                if self._pending is pending:
+                    pending.update(self._resolved)
+
+                self._raw, self._dependents = raw, dependents
+                self._pending = pending
+                raise
+            finally:
+                self._staged = None
+                self._resolved = {}
+
+    def _resolved_items(self) -> Generator:
+        """Iterate over the resolved variables and the custom attributes,
+        without resolving the pending variables."""
+
+        yield from list(self._store.items())
+
+    def __setattr__(self, name: str, val: Any) -> None:
+        """Set an attribute in the variables store, and forget the
+        memoized selections. The internals are set in their slots.
+        A pending variable is not resolved anymore, so the value set
+        is kept."""
+
+        if name in _INTERNALS:
+            object.__setattr__(self, name, val)
+            return
+
+        with self._lock:
+            self._pending.pop(name, None)
+            self._selections = {}
+            self._assign(name, val)
+
+    def __delattr__(self, name: str) -> None:
+        """Delete an attribute from the variables store, and forget the
+        memoized selections. A pending variable is deleted without
+        being resolved."""
+
+        with self._lock:
+            pending: bool = self._pending.pop(name, None) is not None
+
+            if name in self._store:
+                with self._staging() as store:
+                    del store[name]
+            elif not pending:
+                object.__delattr__(self, name)
+
+    def __getattr__(self, name: str) -> Any:
+        """Get a pending variable, resolving it on its first access.
+        Only called when the attribute lookup missed (the resolved
+        variables being found in the instance __dict__), so only the
+        misses wait for the writers.
+
+        Args:
+            name (str): The attribute name.
+
+        Raises:
+            AttributeError: If the attribute doesn't exists.
+
+        Returns:
+            Any: The variable value.
+        """
+
+        if name not in _INTERNALS and not name.startswith('__'):
+            with self._lock:
+                if name in self._pending:
+                    self._resolve([name])
+
+                store: Dict[str, Any] = (
+                    self._staged if self._staged is not None else self._store
+                )
+
+                if name in store:
+                    return store[name]
+
+        raise AttributeError(
+            f'\'{type(self).__name__}\' object has no attribute \'{name}\''
+        )
 
     def __iter__(self) -> Generator:
-        """Overload the __iter__ method for suppress useless attributes."""
+        """Overload the __iter__ method for suppress useless attributes.
+        The pending variables are resolved first."""
+
+        if self._pending:
+            self._resolve(list(self._pending))
 
-        for key, val in self.__dict__.items():
-            if key not in self._SKIPED_ATTR:
-                yield key, val
\ No newline at end of file
+        yield from self._resolved_items()
@@ -21,11 +21,10 @@ def patched_syenv(
     monkeypatch: MonkeyPatch, prefix: str
 ) -> Callable[[bool], Syenv]:
     def handler(keep_prefix: bool = False) -> Syenv:
-        monkeypatch.setattr(Syenv, '__init__', lambda self: None)
-        env: Syenv = Syenv()
-        env._prefix = prefix
-        env._type_separator = '::'
-        env._keep_prefix = keep_prefix
+        with monkeypatch.context() as patch:
+            patch.setattr(Syenv, '_loadenv', lambda self: None)
+            env: Syenv = Syenv(prefix, keep_prefix=keep_prefix)
+
         return env
 
     return handler
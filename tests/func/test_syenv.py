@@ -1,4 +1,5 @@
 from typing import Any, Callable, Dict
+import pytest
 from syenv import Syenv
 
 
@@ -10,4 +11,52 @@ class TestSensy:
 
         for key, val in env.__iter__():
             assert val == expected_env()[key]
-            assert type(val) == type(expected_env()[key])
\ No newline at end of file
+            assert type(val) == type(expected_env()[key])
+
+    def test_custom_class(
+        self, prefix: str, expected_env: Callable[[bool], Dict[str, Any]]
+    ) -> None:
+        class Config(Syenv):
+            STR_VAR: str = 'default'
+
+            def __init__(self, prefix: str) -> None:
+                self.early_var: str = 'Hi!'
+                super().__init__(prefix)
+
+                self.another_var: str = 'Hey!'
+
+            @property
+            def int_uri(self) -> str:
+                return f'int://{self.INT_VAR}'
+
+        conf: Config = Config(prefix)
+
+        assert conf.as_dict == {
+            'early_var': 'Hi!',
+            **expected_env(),
+            'another_var': 'Hey!',
+        }
+        assert conf.STR_VAR == 'some string'
+        assert conf.int_uri == 'int://10'
+
+        with pytest.raises(AttributeError):
+            conf.int_uri = 'read only'
+
+    def test_store(self, prefix: str) -> None:
+        env: Syenv = Syenv(prefix)
+
+        assert vars(env) == env.as_dict
+        assert env.as_mapping['INT_VAR'] == 10
+        assert env.as_mapping == env.as_dict
+
+        with pytest.raises(TypeError):
+            env.as_mapping['INT_VAR'] = 11
+
+        env.INT_VAR = 11
+        del env.STR_VAR
+
+        assert env.as_mapping['INT_VAR'] == 11
+        assert 'STR_VAR' not in env.as_mapping
+
+        with pytest.raises(AttributeError):
+            env.STR_VAR
@@ -0,0 +1,120 @@
+from array import array
+from decimal import Decimal
+from pathlib import Path
+from typing import Any
+from _pytest.monkeypatch import MonkeyPatch
+import pytest
+from syenv import Syenv
+from syenv.converters import ConverterRegistry
+from syenv.exceptions import ConverterError, SysenvError
+
+
+class TestConverterRegistry:
+    def test_resolve(self) -> None:
+        registry: ConverterRegistry = ConverterRegistry()
+
+        assert registry.resolve('int') is int
+        assert registry.resolve('pathlib.Path') is Path
+        assert registry.resolve('decimal.Decimal') is Decimal
+        assert registry.resolve('decimal.Decimal') is Decimal
+        assert registry.cache_info.misses == 1
+        assert registry.cache_info.hits == 1
+
+        with pytest.raises(SysenvError):
+            registry.resolve('unknown_type')
+
+    def test_register(self) -> None:
+        registry: ConverterRegistry = ConverterRegistry()
+        registry.register('csv', lambda val: val.split(','))
+
+        @registry.register('int')
+        def to_int(val: str) -> int:
+            return int(val) * 2
+
+        assert registry.resolve('csv')('a,b') == ['a', 'b']
+        assert registry.resolve('int') is to_int
+        assert 'csv' in registry
+
+        registry.unregister('int')
+        registry.unregister('csv')
+
+        assert registry.resolve('int') is int
+        assert 'csv' not in registry
+
+        with pytest.raises(SysenvError):
+            registry.register('wrong', 'not callable')
+
+    def test_syenv_converters(self, prefix: str) -> None:
+        registry: ConverterRegistry = ConverterRegistry()
+        registry.register('int', lambda val: -int(val))
+        env: Syenv = Syenv(prefix, converters=registry)
+        result: Any = env.INT_VAR
+
+        assert result == -10
+        assert Syenv(prefix).INT_VAR == 10
+
+    def test_collections(self) -> None:
+        registry: ConverterRegistry = ConverterRegistry()
+
+        assert registry.resolve('list[int]')('1,2,3') == [1, 2, 3]
+        assert registry.resolve('list[int]')('') == []
+        assert registry.resolve('tuple[str]')(r'a\,b,c\\') == ('a,b', 'c\\')
+        assert registry.resolve('frozenset[float]')('1,1') == {1.0}
+        assert registry.resolve('dict[str, int]')('a=1,b=2') == {
+            'a': 1,
+            'b': 2,
+        }
+        assert registry.resolve('dict[str,str]')(r'a\=b=c\,d,e=') == {
+            'a=b': 'c,d',
+            'e': '',
+        }
+        assert registry.resolve("array('q')")('1,2') == array('q', [1, 2])
+        assert registry.resolve('array("d")')('1.5') == array('d', [1.5])
+        assert registry.resolve('list[pathlib.Path]')('a,b') == [
+            Path('a'),
+            Path('b'),
+        ]
+        assert registry.resolve('list[bool]')('True,False,0,yes') == [
+            True,
+            False,
+            False,
+            True,
+        ]
+        assert registry.resolve('dict[str,bool]')('a=no') == {'a': False}
+
+    def test_collections_errors(self) -> None:
+        registry: ConverterRegistry = ConverterRegistry()
+
+        for name, val in [
+            ('list[int]', '1,x'),
+            ("array('b')", '1,1000'),
+            ('dict[str,int]', 'a=1,b'),
+            ('dict[str,int]', 'a=1=2'),
+            ('list[str]', 'a\\'),
+            ('list[bool]', 'True,'),
+        ]:
+            with pytest.raises(ValueError):
+                registry.resolve(name)(val)
+
+        for name in ["array('z')", 'list[unknown_type]', 'list[]']:
+            assert not registry.exists(name)
+
+    def test_syenv_collections(self, monkeypatch: MonkeyPatch) -> None:
+        monkeypatch.setenv('SYENV_COLL_SHARDS', "array('q')::1,2,3")
+        monkeypatch.setenv('SYENV_COLL_URL', 'str::http://host::8080')
+        monkeypatch.setenv('SYENV_COLL_RAW', 'not_a_type::a::b')
+        monkeypatch.setenv(
+            'SYENV_COLL_SHARED', 'list[int]::{{SYENV_COLL_ONE}},2'
+        )
+        monkeypatch.setenv('SYENV_COLL_ONE', 'int::1')
+        env: Syenv = Syenv('SYENV_COLL_')
+
+        assert env.SHARDS == array('q', [1, 2, 3])
+        assert env.URL == 'http://host::8080'
+        assert env.RAW == 'not_a_type::a::b'
+        assert env.SHARED == [1, 2]
+
+        monkeypatch.setenv('SYENV_COLL_WRONG', "array('z')::1")
+
+        with pytest.raises(ConverterError, match='typecode "z"'):
+            Syenv('SYENV_COLL_')
@@ -0,0 +1,63 @@
+from multiprocessing import get_context
+from multiprocessing.queues import Queue
+from pathlib import Path
+from threading import Lock
+import pytest
+from _pytest.monkeypatch import MonkeyPatch
+from syenv import Syenv
+from syenv.converters import ConverterRegistry
+from syenv.exceptions import SysenvError
+from syenv.frozen import FrozenSyenv
+
+
+def _read_in_worker(name: str, queue: Queue) -> None:
+    with FrozenSyenv.attach(name) as frozen:
+        queue.put(frozen.INTERP_SPECIFIC)
+
+
+class TestFrozenSyenv:
+    def test_freeze(self, prefix: str) -> None:
+        env: Syenv = Syenv(prefix, lazy=True)
+
+        with FrozenSyenv.freeze(env) as frozen:
+            attached: FrozenSyenv = FrozenSyenv.attach(frozen.name)
+
+            assert attached.as_dict == env.as_dict
+            assert len(attached) == len(env.as_dict)
+            assert 'INT_VAR' in attached
+            assert attached.INTERP_SPECIFIC == Path('tests/.env')
+            assert attached.from_pattern('BOOL_VAR_', to_lower=True) == {
+                'bool_var_true': True,
+                'bool_var_false': True,
+            }
+
+            with pytest.raises(AttributeError):
+                attached.UNKNOWN_VAR
+
+            with pytest.raises(SysenvError):
+                attached.INT_VAR = 11
+
+            attached.close()
+
+    def test_worker(self, prefix: str) -> None:
+        ctx = get_context('spawn')
+        queue: Queue = ctx.Queue()
+
+        with FrozenSyenv.freeze(Syenv(prefix)) as frozen:
+            worker = ctx.Process(
+                target=_read_in_worker, args=(frozen.name, queue)
+            )
+            worker.start()
+
+            assert queue.get(timeout=30) == Path('tests/.env')
+
+            worker.join()
+
+    def test_unpicklable(self, monkeypatch: MonkeyPatch) -> None:
+        registry: ConverterRegistry = ConverterRegistry()
+        registry.register('lock', lambda val: Lock())
+        monkeypatch.setenv('SYENV_FROZEN_LOCK', 'lock::')
+        env: Syenv = Syenv('SYENV_FROZEN_', converters=registry)
+
+        with pytest.raises(SysenvError):
+            FrozenSyenv.freeze(env)
@@ -0,0 +1,48 @@
+from pathlib import Path
+from typing import Dict, List, Tuple
+from _pytest.monkeypatch import MonkeyPatch
+import pytest
+from syenv import Syenv
+from syenv.exceptions import SysenvError
+from syenv.interpolation import Template, compile_template, resolution_order
+
+
+class TestInterpolation:
+    def test_compile_template(self) -> None:
+        template: Template = compile_template('{{A}}/{{B}} and {{A}}')
+
+        assert template.keys == ('A', 'B', 'A')
+        assert template.render({'A': 1, 'B': Path('b')}.get) == '1/b and 1'
+        assert compile_template('{{A}}/{{B}} and {{A}}') is template
+        assert compile_template('no keys').render(None) == 'no keys'
+        assert compile_template('no keys') is not compile_template('no keys')
+
+    def test_resolution_order(self) -> None:
+        graph: Dict[str, Tuple[str, ...]] = {
+            'C': ('B', 'A'),
+            'B': ('A', 'OUTSIDE'),
+            'A': (),
+            'D': (),
+        }
+        order: List[str] = resolution_order(graph)
+
+        assert order == ['A', 'D', 'B', 'C']
+
+        with pytest.raises(SysenvError, match='A -> B -> C -> A'):
+            resolution_order({'A': ('B',), 'B': ('C',), 'C': ('A',)})
+
+        with pytest.raises(SysenvError, match='A -> A'):
+            resolution_order({'A': ('A',)})
+
+    def test_forward_reference(self, monkeypatch: MonkeyPatch) -> None:
+        monkeypatch.setenv('SYENV_FWD_URL', '{{SYENV_FWD_BASE}}/api')
+        monkeypatch.setenv('SYENV_FWD_BASE', '{{SYENV_FWD_HOST}}:80')
+        monkeypatch.setenv('SYENV_FWD_HOST', 'http://localhost')
+        env: Syenv = Syenv('SYENV_FWD_')
+
+        assert env.URL == 'http://localhost:80/api'
+
+        monkeypatch.setenv('SYENV_FWD_HOST', '{{SYENV_FWD_URL}}')
+
+        with pytest.raises(SysenvError, match='Circular'):
+            Syenv('SYENV_FWD_')
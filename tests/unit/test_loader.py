@@ -0,0 +1,48 @@
+from typing import Dict
+from _pytest.monkeypatch import MonkeyPatch
+import pytest
+from syenv import Syenv
+from syenv.loader import EnvIndex
+
+
+class TestEnvIndex:
+    def test_select(self) -> None:
+        index: EnvIndex = EnvIndex(
+            {'DB_HOST': 'db', 'DB.PORT': 'int::5432', 'DBX': 'x', 'A': 'a'}
+        )
+
+        assert len(index) == 4
+        assert index.select('DB_') == {'DB_HOST': 'db'}
+        assert index.select('DB.') == {'DB.PORT': 'int::5432'}
+        assert index.select('Z') == {}
+        assert len(index.select('')) == 4
+
+    def test_load(self, monkeypatch: MonkeyPatch) -> None:
+        index: EnvIndex = EnvIndex(
+            {
+                'DB_HOST': 'db',
+                'DB_URL': 'pg://{{DB_HOST}}:{{DB_PORT}}',
+                'DB_PORT': 'int::5432',
+                'CACHE_TTL': 'int::60',
+            }
+        )
+        monkeypatch.setenv('DB_HOST', 'not indexed')
+        envs: Dict[str, Syenv] = index.load('DB_', 'CACHE_')
+
+        assert envs['DB_'].as_dict == {
+            'HOST': 'db',
+            'PORT': 5432,
+            'URL': 'pg://db:5432',
+        }
+        assert envs['CACHE_'].as_dict == {'TTL': 60}
+
+        with pytest.warns(DeprecationWarning):
+            env: Syenv = Syenv('CACHE_', index=index)
+
+        assert env.TTL == 60
+
+    def test_plain_prefix(self, monkeypatch: MonkeyPatch) -> None:
+        monkeypatch.setenv('SYENV.DOT_VAR', 'dot')
+        monkeypatch.setenv('SYENV_DOT_VAR', 'underscore')
+
+        assert Syenv('SYENV.').as_dict == {'DOT_VAR': 'dot'}
@@ -0,0 +1,196 @@
+import asyncio
+from pathlib import Path
+from typing import Any, ClassVar, Dict, List, Optional, Set, Tuple
+import pytest
+from syenv import Field, Schema
+from syenv.exceptions import SchemaError, SysenvError
+from syenv.sources import MappingSource
+from syenv.syenv import ChangeSet
+
+
+class AppSchema(Schema, prefix='APP_'):
+    HOST: str
+    PORT: int = 8000
+    URL: str
+    TAGS: List[str] = Field(default=[], alias='ALLOWED_TAGS')
+    WEIGHTS: Dict[str, float] = {}
+    ROOT: Optional[Path]
+    INSTANCES: ClassVar[int] = 0
+
+
+class TestSchema:
+    def test_compile(self) -> None:
+        fields: Dict[str, Field] = {f.name: f for f in AppSchema.fields()}
+
+        assert list(fields) == [
+            'HOST',
+            'PORT',
+            'URL',
+            'TAGS',
+            'WEIGHTS',
+            'ROOT',
+        ]
+        assert fields['HOST'].required
+        assert fields['PORT'].converter is int
+        assert fields['TAGS'].key == 'ALLOWED_TAGS'
+        assert fields['ROOT'].converter is Path
+        assert fields['ROOT'].default is None
+        assert isinstance(AppSchema.__dict__['HOST'], property)
+
+        with pytest.raises(SysenvError):
+
+            class AnySchema(Schema):
+                VALUE: Any
+
+        with pytest.raises(SysenvError):
+
+            class TupleSchema(Schema):
+                VALUE: Tuple[int, str]
+
+    def test_load(self) -> None:
+        source: MappingSource = MappingSource(
+            {
+                'APP_HOST': 'localhost',
+                'APP_URL': 'http://{{APP_HOST}}:{{APP_PORT}}',
+                'APP_PORT': '8080',
+                'APP_ALLOWED_TAGS': 'a,b',
+                'APP_UNDECLARED': 'ignored',
+                'TENANT_HOST': 'tenant.local',
+                'TENANT_URL': '{{TENANT_HOST}}',
+            }
+        )
+        env: AppSchema = AppSchema(source=source)
+
+        assert env.as_dict == {
+            'HOST': 'localhost',
+            'PORT': 8080,
+            'URL': 'http://localhost:8080',
+            'TAGS': ['a', 'b'],
+            'WEIGHTS': {},
+            'ROOT': None,
+        }
+        assert AppSchema('TENANT_', source=source).URL == 'tenant.local'
+        assert AppSchema('TENANT_', source=source).PORT == 8000
+
+        with pytest.raises(AttributeError):
+            env.UNDECLARED
+
+        tenant: AppSchema = AppSchema('TENANT_', source=source)
+        tenant.TAGS.append('a')
+        tenant.WEIGHTS['a'] = 1.0
+
+        assert AppSchema('TENANT_', source=source).TAGS == []
+        assert AppSchema('TENANT_', source=source).WEIGHTS == {}
+
+        env.PORT = 9000
+        assert env.PORT == 9000
+        del env.PORT
+
+        with pytest.raises(AttributeError):
+            env.PORT
+
+    def test_errors(self) -> None:
+        source: MappingSource = MappingSource(
+            {'APP_PORT': 'http', 'APP_WEIGHTS': 'a=1,b', 'APP_URL': 'url'}
+        )
+
+        with pytest.raises(SchemaError) as e:
+            AppSchema(source=source)
+
+        assert list(e.value.errors) == ['HOST', 'PORT', 'WEIGHTS']
+        assert 'APP_HOST' in e.value.errors['HOST']
+        assert '3 invalid variable(s)' in str(e.value)
+
+    def test_bool(self) -> None:
+        class FlagsSchema(Schema, prefix='FLAG_'):
+            ON: bool
+            OFF: bool
+            MANY: List[bool] = []
+
+        env: FlagsSchema = FlagsSchema(
+            source=MappingSource(
+                {'FLAG_ON': 'Yes', 'FLAG_OFF': 'false', 'FLAG_MANY': '1,0'}
+            )
+        )
+
+        assert (env.ON, env.OFF, env.MANY) == (True, False, [True, False])
+
+        with pytest.raises(SchemaError) as e:
+            FlagsSchema(
+                source=MappingSource({'FLAG_ON': 'x', 'FLAG_OFF': '0'})
+            )
+
+        assert list(e.value.errors) == ['ON']
+
+    def test_interpolation_errors(self) -> None:
+        source: MappingSource = MappingSource(
+            {
+                'APP_HOST': 'localhost',
+                'APP_URL': '{{APP_HOST}}',
+                'APP_EXTRA': '{{APP_NOPE}}',
+                'APP_PORT': '{{APP_LOOP}}',
+                'APP_LOOP': '{{APP_PORT}}',
+                'APP_ALLOWED_TAGS': '{{APP_NOPE}}',
+            }
+        )
+
+        with pytest.raises(SchemaError) as e:
+            AppSchema(source=source)
+
+        assert list(e.value.errors) == ['PORT', 'TAGS']
+        assert 'Circular' in e.value.errors['PORT']
+        assert 'APP_NOPE' in e.value.errors['TAGS']
+
+        del source.mapping['APP_PORT'], source.mapping['APP_ALLOWED_TAGS']
+
+        assert AppSchema(source=source).URL == 'localhost'
+
+    def test_inheritance(self) -> None:
+        class ChildSchema(AppSchema, prefix='CHILD_'):
+            PORT = 443
+            HOST = Field('child.local')
+            DEBUG: Set[int] = set()
+
+        env: ChildSchema = ChildSchema(
+            source=MappingSource({'CHILD_URL': 'url', 'CHILD_DEBUG': '1,1'})
+        )
+
+        assert [f.name for f in ChildSchema.fields()][-1] == 'DEBUG'
+        assert env.HOST == 'child.local'
+        assert env.PORT == 443
+        assert env.DEBUG == {1}
+        assert AppSchema.fields()[1].default == 8000
+
+    def test_reload(self) -> None:
+        variables: Dict[str, str] = {
+            'APP_HOST': 'localhost',
+            'APP_URL': '{{APP_HOST}}',
+            'APP_ROOT': 'root',
+        }
+        env: AppSchema = AppSchema(source=MappingSource(variables))
+        variables.update({'APP_HOST': 'remote', 'APP_PORT': '1'})
+        del variables['APP_ROOT']
+
+        assert env.reload() == ChangeSet(
+            added=('PORT',),
+            changed=('HOST',),
+            removed=('ROOT',),
+            dependents=('URL',),
+        )
+        assert (env.URL, env.PORT, env.ROOT) == ('remote', 1, None)
+
+        variables['APP_PORT'] = 'nan'
+
+        with pytest.raises(SchemaError):
+            env.reload()
+
+        assert env.PORT == 1
+
+    def test_aload(self) -> None:
+        env: AppSchema = asyncio.run(
+            AppSchema.aload(
+                source=MappingSource({'APP_HOST': 'h', 'APP_URL': 'u'})
+            )
+        )
+
+        assert (env.HOST, env.PORT) == ('h', 8000)
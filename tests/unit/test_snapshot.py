@@ -0,0 +1,69 @@
+from pathlib import Path
+from threading import Lock
+from typing import Any, List
+from _pytest.monkeypatch import MonkeyPatch
+from syenv import Syenv
+from syenv.converters import ConverterRegistry
+from syenv.snapshot import SnapshotCache
+
+
+class TestSnapshotCache:
+    def test_save_load(self, tmp_path: Path) -> None:
+        cache: SnapshotCache = SnapshotCache(tmp_path / 'sub' / 'env.pickle')
+        cache.save('key', {'PATH': Path('tests'), 'LOCK': Lock()})
+
+        assert cache.load('key') == {'PATH': Path('tests')}
+        assert cache.load('other') is None
+        assert [p.name for p in cache.path.parent.iterdir()] == ['env.pickle']
+
+        cache.path.write_bytes(b'corrupted')
+
+        assert cache.load('key') is None
+
+    def test_key(self) -> None:
+        cache: SnapshotCache = SnapshotCache('unused')
+        registry: ConverterRegistry = ConverterRegistry()
+        key: str = cache.key({'A': '1'}, 'P_', '::', False, registry)
+
+        assert key == cache.key({'A': '1'}, 'P_', '::', False, registry)
+        assert key != cache.key({'A': '2'}, 'P_', '::', False, registry)
+        assert key != cache.key({'A': '1'}, 'P_', '::', True, registry)
+
+        registry.register('upper', str.upper)
+
+        assert key != cache.key({'A': '1'}, 'P_', '::', False, registry)
+
+        registry.register('f', lambda val: val + '1')
+        key = cache.key({'A': '1'}, 'P_', '::', False, registry)
+        registry.register('f', lambda val: val + '2')
+
+        assert key != cache.key({'A': '1'}, 'P_', '::', False, registry)
+
+    def test_syenv_snapshot(
+        self, tmp_path: Path, monkeypatch: MonkeyPatch
+    ) -> None:
+        calls: List[str] = []
+        registry: ConverterRegistry = ConverterRegistry()
+        registry.register('lock', lambda val: calls.append(val) or Lock())
+        registry.register('log', lambda val: calls.append(val) or val)
+        cache: SnapshotCache = SnapshotCache(tmp_path / 'env.pickle')
+        monkeypatch.setenv('SYENV_SNAP_HOST', 'log::db')
+        monkeypatch.setenv('SYENV_SNAP_LOCK', 'lock::{{SYENV_SNAP_HOST}}')
+
+        def load() -> Any:
+            return Syenv('SYENV_SNAP_', converters=registry, snapshot=cache)
+
+        assert load().HOST == 'db'
+        assert calls == ['db', 'db']
+
+        calls.clear()
+        env: Syenv = load()
+
+        assert env.HOST == 'db'
+        assert calls == ['db']
+
+        monkeypatch.setenv('SYENV_SNAP_HOST', 'log::replica')
+        calls.clear()
+
+        assert load().HOST == 'replica'
+        assert calls == ['replica', 'replica']
@@ -0,0 +1,89 @@
+from pathlib import Path
+from typing import Any, Callable, Dict
+from _pytest.monkeypatch import MonkeyPatch
+import pytest
+from syenv.exceptions import SysenvError
+from syenv import Syenv
+from syenv.sources import (
+    EnvFileSource,
+    EnvironSource,
+    MappingSource,
+    Source,
+)
+
+FAKE_ENV_FILE: Path = Path('tests/.env')
+
+
+class TestSources:
+    def test_source(self) -> None:
+        with pytest.raises(TypeError):
+            Source()
+
+    def test_mapping_source(self, monkeypatch: MonkeyPatch) -> None:
+        source: MappingSource = MappingSource({'A_X': '1', 'B_X': '2'})
+        monkeypatch.setenv('SYENV_SOURCE_VAR', 'value')
+
+        assert source.select('A_') == {'A_X': '1'}
+        assert EnvironSource().select('SYENV_SOURCE_') == {
+            'SYENV_SOURCE_VAR': 'value'
+        }
+
+    def test_env_file_source(self, tmp_path: Path) -> None:
+        env_file: Path = tmp_path / '.env'
+        env_file.write_text(
+            '# APP_COMMENTED=1\n'
+            'APP_HOST=localhost\r\n'
+            '  export APP_PORT = int::8080\n'
+            'OTHER_VAR=ignored\n'
+            'APP_QUOTED="hello world"\n'
+            "APP_SINGLE='{{APP_HOST}}:{{APP_PORT}}'\n"
+            'APP_EMPTY=\n'
+            'APP_URL=http://x#anchor # comment\n'
+            'APP_MULTI="first\n  second \\"quoted\\"" # comment\n'
+            'APP_HOST=overridden',
+            encoding='utf-8',
+        )
+
+        assert EnvFileSource(env_file).select('APP_') == {
+            'APP_HOST': 'overridden',
+            'APP_PORT': 'int::8080',
+            'APP_QUOTED': 'hello world',
+            'APP_SINGLE': '{{APP_HOST}}:{{APP_PORT}}',
+            'APP_EMPTY': '',
+            'APP_URL': 'http://x#anchor',
+            'APP_MULTI': 'first\n  second "quoted"',
+        }
+
+        env_file.write_text(
+            'B_CERT="-----BEGIN\nA_Y=leaked\n-----END"\n'
+            'A_X="a\\\\"\n'
+            'A_Z="\\\\\\"q\\\\n"\n',
+            encoding='utf-8',
+        )
+
+        assert EnvFileSource(env_file).select('A_') == {
+            'A_X': 'a\\',
+            'A_Z': '\\"q\\n',
+        }
+        assert EnvFileSource(env_file).select('')['B_CERT'] == (
+            '-----BEGIN\nA_Y=leaked\n-----END'
+        )
+
+        env_file.write_text('APP_OPEN="never closed\n', encoding='utf-8')
+
+        with pytest.raises(SysenvError):
+            EnvFileSource(env_file).select('APP_')
+
+        env_file.write_text('', encoding='utf-8')
+
+        assert EnvFileSource(env_file).select('APP_') == {}
+
+    def test_syenv_source(
+        self, prefix: str, expected_env: Callable[[bool], Dict[str, Any]]
+    ) -> None:
+        env: Syenv = Syenv(prefix, source=EnvFileSource(FAKE_ENV_FILE))
+
+        assert env.as_dict == expected_env()
+        assert Syenv(
+            'A_', source=MappingSource({'A_X': 'int::1'})
+        ).as_dict == {'X': 1}
@@ -0,0 +1,27 @@
+from typing import List, Tuple
+from _pytest.monkeypatch import MonkeyPatch
+from syenv import Syenv
+from syenv.converters import ConverterRegistry
+from syenv.stats import LoadStats
+
+
+class TestLoadStats:
+    def test_stats(self, monkeypatch: MonkeyPatch) -> None:
+        measures: List[Tuple[str, str, float]] = []
+        stats: LoadStats = LoadStats()
+        stats.add_callback(lambda *measure: measures.append(measure))
+        monkeypatch.setenv('SYENV_STATS_ROOT', 'pathlib.Path::/srv')
+        monkeypatch.setenv('SYENV_STATS_DIR', '{{SYENV_STATS_ROOT}}/app')
+        monkeypatch.setenv('SYENV_STATS_LOG', '{{SYENV_STATS_DIR}}/log')
+        monkeypatch.setenv('SYENV_STATS_AMOUNT', 'decimal.Decimal::1.5')
+        Syenv('SYENV_STATS_', stats=stats, converters=ConverterRegistry())
+
+        assert stats.depths == {'ROOT': 0, 'AMOUNT': 0, 'DIR': 1, 'LOG': 2}
+        assert set(stats.timings['LOG']) == {'interpolate', 'parse'}
+        assert set(stats.loads) == {'SYENV_STATS_'}
+        assert (stats.resolutions, stats.cache_misses) == (4, 1)
+        assert stats.cache_hits == 3
+        assert stats.current is None
+        assert len(stats.slowest(2)) == 2
+        assert ('load', 'SYENV_STATS_') == measures[-1][:2]
+        assert ('parse', 'AMOUNT') in [measure[:2] for measure in measures]
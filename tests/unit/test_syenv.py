@@ -1,9 +1,17 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from pydoc import locate
-from typing import Any, Callable, Dict
+from typing import Any, Callable, Dict, List
+from _pytest.monkeypatch import MonkeyPatch
 import pytest
-from syenv import Syenv
+import threading
+import time
+import warnings
+from syenv import ChangeSet, MappingSource, PinnedSyenv, Syenv
+from syenv.converters import ConverterRegistry
 from syenv.exceptions import SysenvError
+from syenv.syenv import _DEFERRED
 
 
 class TestSensy:
@@ -92,4 +100,431 @@ class TestSensy:
             'SYENV_TEST_MULTI_INTERP_SPE_3': 'this is my test!',
         }
 
-        assert env.from_pattern('MULTI_INTERP_', keep_pattern=True) == expected
\ No newline at end of file
+        assert env.from_pattern('MULTI_INTERP_', keep_pattern=True) == expected
+
+    def test_from_pattern_cache(self, prefix: str) -> None:
+        env: Syenv = Syenv(prefix)
+        selected: Dict[str, Any] = env.from_pattern(
+            'BOOL_VAR_', keep_pattern=True, to_lower=True
+        )
+
+        assert selected == {'bool_var_true': True, 'bool_var_false': True}
+        assert env.from_pattern(r'^BOOL_.+_TRUE$') == {'BOOL_VAR_TRUE': True}
+
+        selected.clear()
+        env.BOOL_VAR_NEW = False
+
+        assert env.from_pattern('BOOL_VAR_') == {
+            'TRUE': True,
+            'FALSE': True,
+            'NEW': False,
+        }
+
+        del env.BOOL_VAR_NEW
+
+        assert env.from_pattern('BOOL_VAR_') == {'TRUE': True, 'FALSE': True}
+
+    def test_reload(self, monkeypatch: MonkeyPatch) -> None:
+        calls: List[str] = []
+        registry: ConverterRegistry = ConverterRegistry()
+        registry.register('log', lambda val: calls.append(val) or val)
+        monkeypatch.setenv('SYENV_RELOAD_HOST', 'log::db')
+        monkeypatch.setenv(
+            'SYENV_RELOAD_URL', 'log::pg://{{SYENV_RELOAD_HOST}}'
+        )
+        monkeypatch.setenv('SYENV_RELOAD_OTHER', 'log::other')
+        monkeypatch.setenv('SYENV_RELOAD_OLD', 'log::old')
+        env: Syenv = Syenv('SYENV_RELOAD_', converters=registry)
+        calls.clear()
+
+        assert env.reload() == ChangeSet()
+        assert not calls
+
+        monkeypatch.setenv('SYENV_RELOAD_HOST', 'log::replica')
+        monkeypatch.setenv('SYENV_RELOAD_NEW', 'log::new')
+        monkeypatch.delenv('SYENV_RELOAD_OLD')
+
+        assert env.reload() == ChangeSet(
+            added=('NEW',),
+            changed=('HOST',),
+            removed=('OLD',),
+            dependents=('URL',),
+        )
+        assert sorted(calls) == ['new', 'pg://replica', 'replica']
+        assert env.URL == 'pg://replica'
+        assert not hasattr(env, 'OLD')
+
+        monkeypatch.delenv('SYENV_RELOAD_HOST')
+
+        with pytest.raises(SysenvError):
+            env.reload()
+
+
+class TestLazySyenv:
+    def test_lazy(self, prefix: str) -> None:
+        calls: List[str] = []
+        registry: ConverterRegistry = ConverterRegistry()
+        registry.register('int', lambda val: calls.append(val) or int(val))
+        env: Syenv = Syenv(prefix, lazy=True, converters=registry)
+
+        assert 'INT_VAR' in env._pending
+        assert not calls
+        assert env.INT_VAR == 10
+        assert env.INT_VAR == 10
+        assert calls == ['10']
+        assert 'INT_VAR' not in env._pending
+
+        with pytest.raises(AttributeError):
+            env.UNKNOWN_VAR
+
+    def test_lazy_interpolation(
+        self, prefix: str, expected_env: Callable[[bool], Dict[str, Any]]
+    ) -> None:
+        env: Syenv = Syenv(prefix, lazy=True)
+
+        assert env.MULTI_INTERP_SPE_3 == 'this is my test!'
+        assert 'MULTI_INTERP_SPE_1' not in env._pending
+        assert 'INTERP_SPECIFIC' in env._pending
+        assert env.from_pattern('INTERP_SPE') == {
+            'CIFIC': Path('tests/.env'),
+            'MULTI__1': 'this is',
+            'MULTI__2': 'my',
+            'MULTI__3': 'this is my test!',
+        }
+        assert 'INT_VAR' in env._pending
+        assert env.as_dict == expected_env()
+        assert env._pending.__sizeof__() == {}.__sizeof__()
+
+    def test_lazy_assignment(self) -> None:
+        env: Syenv = Syenv(
+            'A_',
+            source=MappingSource({'A_X': 'int::1', 'A_Y': 'int::2'}),
+            lazy=True,
+        )
+        env.X = 100
+        del env.Y
+
+        assert env.as_dict == {'X': 100}
+
+        with pytest.raises(AttributeError):
+            env.Y
+
+        with pytest.raises(AttributeError):
+            del env.Y
+
+
+class TestConcurrentSyenv:
+    @pytest.fixture
+    def slow_env(self, monkeypatch: MonkeyPatch) -> Callable[[str], None]:
+        def handler(env_type: str) -> None:
+            monkeypatch.setenv('SYENV_CONC_BASE', f'{env_type}::base')
+            monkeypatch.setenv(
+                'SYENV_CONC_DEEP', 'str::{{SYENV_CONC_VAR_0}}/deep'
+            )
+
+            for i in range(5):
+                monkeypatch.setenv(
+                    f'SYENV_CONC_VAR_{i}',
+                    f'{env_type}::{{{{SYENV_CONC_BASE}}}}{i}',
+                )
+
+        return handler
+
+    @pytest.fixture
+    def slow_registry(self) -> ConverterRegistry:
+        registry: ConverterRegistry = ConverterRegistry()
+        registry.durations = []
+
+        @registry.register('slow')
+        def slow(val: str) -> str:
+            start: float = time.perf_counter()
+            time.sleep(0.1)
+            registry.durations.append(time.perf_counter() - start)
+            return val
+
+        @registry.register('aslow')
+        async def aslow(val: str) -> str:
+            start: float = time.perf_counter()
+            await asyncio.sleep(0.1)
+            registry.durations.append(time.perf_counter() - start)
+            return val
+
+        return registry
+
+    def test_executor(
+        self,
+        slow_env: Callable[[str], None],
+        slow_registry: ConverterRegistry,
+    ) -> None:
+        slow_env('slow')
+        start: float = time.perf_counter()
+
+        with ThreadPoolExecutor(max_workers=5) as executor:
+            env: Syenv = Syenv(
+                'SYENV_CONC_', converters=slow_registry, executor=executor
+            )
+
+        assert time.perf_counter() - start < sum(slow_registry.durations) / 2
+        assert env.DEEP == 'base0/deep'
+        assert env.as_dict['VAR_4'] == 'base4'
+
+    def test_aload(
+        self,
+        slow_env: Callable[[str], None],
+        slow_registry: ConverterRegistry,
+    ) -> None:
+        slow_env('aslow')
+        start: float = time.perf_counter()
+        env: Syenv = asyncio.run(
+            Syenv.aload('SYENV_CONC_', converters=slow_registry)
+        )
+
+        assert time.perf_counter() - start < sum(slow_registry.durations) / 2
+        assert env.DEEP == 'base0/deep'
+        assert env.as_dict['VAR_4'] == 'base4'
+        assert not env._pending
+
+    def test_sync_async_converter(
+        self,
+        monkeypatch: MonkeyPatch,
+        slow_env: Callable[[str], None],
+        slow_registry: ConverterRegistry,
+    ) -> None:
+        slow_env('aslow')
+        env: Syenv = asyncio.run(
+            Syenv.aload('SYENV_CONC_', converters=slow_registry)
+        )
+        monkeypatch.setenv('SYENV_CONC_BASE', 'aslow::new')
+
+        with warnings.catch_warnings():
+            warnings.simplefilter('error')
+
+            with pytest.raises(SysenvError):
+                env.reload()
+
+            with pytest.raises(SysenvError):
+                Syenv('SYENV_CONC_', converters=slow_registry)
+
+        assert env.as_dict['VAR_4'] == 'base4'
+
+    def test_aload_subclass(
+        self,
+        slow_env: Callable[[str], None],
+        slow_registry: ConverterRegistry,
+    ) -> None:
+        class Config(Syenv):
+            def __init__(self, prefix: str = 'SYENV_CONC_') -> None:
+                super().__init__(prefix, converters=slow_registry)
+                self.another_var: str = 'Hey!'
+
+        slow_env('aslow')
+        env: Config = asyncio.run(Config.aload())
+
+        assert isinstance(env, Config)
+        assert env.DEEP == 'base0/deep'
+        assert env.another_var == 'Hey!'
+        assert not env._pending and not env._lazy
+        assert _DEFERRED.get() is None
+
+
+class TestCopyOnWriteSyenv:
+    @pytest.fixture
+    def versioned(self) -> Callable[[int], Dict[str, str]]:
+        def handler(version: int) -> Dict[str, str]:
+            return {
+                'COW_A': f'slow::{version}',
+                'COW_B': 'slow::{{COW_A}}',
+                'COW_C': f'int::{version}',
+            }
+
+        return handler
+
+    @pytest.fixture
+    def counting_registry(self) -> ConverterRegistry:
+        registry: ConverterRegistry = ConverterRegistry()
+        registry.calls = 0
+
+        @registry.register('slow')
+        def slow(val: str) -> str:
+            registry.calls += 1
+            time.sleep(0.001)
+            return val
+
+        return registry
+
+    def test_pin(
+        self,
+        versioned: Callable[[int], Dict[str, str]],
+        counting_registry: ConverterRegistry,
+    ) -> None:
+        variables: Dict[str, str] = versioned(1)
+        env: Syenv = Syenv(
+            'COW_',
+            source=MappingSource(variables),
+            converters=counting_registry,
+        )
+        pinned: PinnedSyenv = env.pin()
+        view: Any = env.as_mapping
+        variables.update(versioned(2))
+        env.reload()
+
+        assert (pinned.A, pinned.B, pinned.C) == ('1', '1', 1)
+        assert dict(view) == pinned.as_dict
+        assert (env.A, env.B, env.C) == ('2', '2', 2)
+        assert pinned.from_pattern('A') == {'': '1'}
+        assert 'C' in pinned and len(pinned) == 3
+
+        with pytest.raises(SysenvError):
+            pinned.C = 3
+
+        with pytest.raises(AttributeError):
+            pinned.D
+
+    def test_failed_reload(
+        self,
+        versioned: Callable[[int], Dict[str, str]],
+        counting_registry: ConverterRegistry,
+    ) -> None:
+        variables: Dict[str, str] = versioned(1)
+        env: Syenv = Syenv(
+            'COW_',
+            source=MappingSource(variables),
+            converters=counting_registry,
+        )
+        variables.update({'COW_A': 'slow::2', 'COW_C': 'int::nan'})
+
+        with pytest.raises(ValueError):
+            env.reload()
+
+        assert env.as_dict == {'A': '1', 'B': '1', 'C': 1}
+
+        variables['COW_C'] = 'int::2'
+
+        assert env.reload() == ChangeSet(changed=('A', 'C'), dependents=('B',))
+        assert env.as_dict == {'A': '2', 'B': '2', 'C': 2}
+
+    def test_failed_reload_state(self) -> None:
+        class Config(Syenv):
+            HOST: str = 'default'
+
+        variables: Dict[str, str] = {
+            'COW_HOST': 'a',
+            'COW_URL': '{{COW_HOST}}/x',
+        }
+        env: Config = Config('COW_', source=MappingSource(variables))
+        variables.update(
+            {'COW_HOST': 'b', 'COW_URL': 'static', 'COW_BAD': 'int::nan'}
+        )
+
+        with pytest.raises(ValueError):
+            env.reload()
+
+        assert env.HOST == env.as_dict['HOST'] == 'a'
+
+        variables.update({'COW_URL': '{{COW_HOST}}/x', 'COW_HOST': 'a'})
+        del variables['COW_BAD']
+
+        assert env.reload() == ChangeSet()
+
+        variables['COW_HOST'] = 'c'
+
+        assert env.reload() == ChangeSet(
+            changed=('HOST',), dependents=('URL',)
+        )
+        assert (env.HOST, env.URL) == ('c', 'c/x')
+
+    def test_in_place(
+        self,
+        versioned: Callable[[int], Dict[str, str]],
+        counting_registry: ConverterRegistry,
+    ) -> None:
+        variables: Dict[str, str] = versioned(1)
+        variables['COW_D'] = 'int::{{COW_C}}x'
+        env: Syenv = Syenv(
+            'COW_',
+            source=MappingSource(variables),
+            converters=counting_registry,
+            lazy=True,
+        )
+
+        with pytest.raises(ValueError):
+            env.D
+
+        assert 'C' in env._pending
+        assert env.C == 1
+
+        variables['COW_D'] = 'int::{{COW_C}}'
+        env.reload()
+        pinned: PinnedSyenv = env.pin()
+        view: Any = env.as_mapping
+        env.E = 5
+
+        assert (
+            pinned.as_dict
+            == dict(view)
+            == {
+                'A': '1',
+                'B': '1',
+                'C': 1,
+                'D': 1,
+            }
+        )
+        assert env.E == 5
+
+    def test_concurrent_reads(
+        self,
+        versioned: Callable[[int], Dict[str, str]],
+        counting_registry: ConverterRegistry,
+    ) -> None:
+        variables: Dict[str, str] = versioned(0)
+        env: Syenv = Syenv(
+            'COW_',
+            source=MappingSource(variables),
+            converters=counting_registry,
+        )
+        torn: List[Any] = []
+        done: threading.Event = threading.Event()
+
+        def read() -> None:
+            while not done.is_set():
+                pinned: PinnedSyenv = env.pin()
+
+                if not pinned.A == pinned.B == str(pinned.C):
+                    torn.append(pinned.as_dict)
+
+        readers: List[threading.Thread] = [
+            threading.Thread(target=read) for _ in range(4)
+        ]
+
+        for reader in readers:
+            reader.start()
+
+        for version in range(1, 30):
+            variables.update(versioned(version))
+            env.reload()
+
+        done.set()
+
+        for reader in readers:
+            reader.join()
+
+        assert not torn
+        assert env.C == 29
+
+    def test_concurrent_lazy(
+        self,
+        versioned: Callable[[int], Dict[str, str]],
+        counting_registry: ConverterRegistry,
+    ) -> None:
+        env: Syenv = Syenv(
+            'COW_',
+            source=MappingSource(versioned(1)),
+            converters=counting_registry,
+            lazy=True,
+        )
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            values: List[str] = list(executor.map(lambda _: env.B, range(16)))
+
+        assert values == ['1'] * 16
+        assert counting_registry.calls == 2